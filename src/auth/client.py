@@ -4,23 +4,61 @@ This module provides the HTTP client for interacting with
 Atlassian's OAuth 2.0 endpoints.
 """
 
+import asyncio
+import logging
 import time
-from datetime import datetime, timedelta
-from typing import List, Optional
-from urllib.parse import urlencode, urlparse
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urlencode
 
 import httpx
+import orjson
 import structlog
 
 from core.base import BaseClient
 from core.config import get_settings
 from core.exceptions import ExternalServiceError, OAuthError
 from core.monitoring import track_external_service
-from models.auth import AuthProvider, AuthTokens, UserInfo
+from models.auth import AuthTokens, UserInfo, UserInfoIngress
 
 settings = get_settings()
 logger = structlog.get_logger(__name__)
 
+# Shared HTTP client for all Atlassian requests. Reusing a single client
+# keeps TCP/TLS connections alive between OAuth calls and allows HTTP/2
+# stream multiplexing under concurrent logins.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client instance.
+
+    Returns:
+        httpx.AsyncClient: Shared HTTP client with connection pooling.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={
+                "Accept": "application/json",
+                # Brotli roughly halves JSON payload sizes vs gzip; httpx
+                # decodes both transparently with the brotli package.
+                "Accept-Encoding": "gzip, br",
+            },
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class AtlassianOAuthClient(BaseClient):
     """HTTP client for Atlassian OAuth 2.0 operations."""
@@ -36,8 +74,37 @@ class AtlassianOAuthClient(BaseClient):
         self.token_url = settings.atlassian_token_url
         self.client_id = settings.atlassian_client_id
         self.client_secret = settings.atlassian_client_secret
+        # Bind static context once so each log call reuses the same bound
+        # logger instead of merging these fields per call.
+        self.logger = self.logger.bind(service="atlassian_oauth")
+        # Checked before INFO logs so production levels above INFO skip
+        # the kwargs dict construction entirely.
+        self._info_enabled = logging.getLogger().isEnabledFor(logging.INFO)
+        self._client = get_http_client()
+        self._refresh_locks: Dict[str, asyncio.Lock] = {}
+        self._inflight_refreshes: Dict[str, "asyncio.Task[AuthTokens]"] = {}
+        # Pre-encode the OAuth parameters that never change between logins
+        # so build_auth_url only has to encode the per-request fields.
+        self._static_auth_params = urlencode({
+            "audience": "api.atlassian.com",
+            "client_id": self.client_id,
+            "response_type": "code",
+            "prompt": "consent",
+        })
+        # Static request pieces reused on every call
+        self._user_info_url = f"{self.base_url}/me"
+        self._token_headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        # Both endpoints are fixed per instance, so their request loggers
+        # are bound once here rather than per call.
+        self._token_request_logger = self._request_logger("POST", self.token_url)
+        self._user_info_request_logger = self._request_logger("GET", self._user_info_url)
+        # Full authorization URL up to (and including) redirect_uri, keyed
+        # by (redirect_uri, scopes). Deployments use a fixed redirect URI
+        # and scope set, so after the first login only the state parameter
+        # is appended per request.
+        self._auth_url_prefixes: Dict[Tuple[str, Tuple[str, ...]], str] = {}
     
-    async def build_auth_url(
+    def build_auth_url(
         self,
         redirect_uri: str,
         state: str,
@@ -53,26 +120,44 @@ class AtlassianOAuthClient(BaseClient):
         Returns:
             str: Authorization URL.
         """
-        params = {
-            "audience": "api.atlassian.com",
-            "client_id": self.client_id,
-            "scope": " ".join(scopes),
-            "redirect_uri": redirect_uri,
-            "state": state,
-            "response_type": "code",
-            "prompt": "consent",
-        }
-        
-        auth_url = f"{self.auth_url}?{urlencode(params)}"
-        
-        self.logger.info(
-            "Built authorization URL",
-            redirect_uri=redirect_uri,
-            scopes=scopes,
+        auth_url = (
+            f"{self._auth_url_prefix(redirect_uri, tuple(scopes))}"
+            f"&state={quote_plus(state)}"
         )
         
+        if self._info_enabled:
+            self.logger.info(
+                "Built authorization URL",
+                redirect_uri=redirect_uri,
+                scopes=scopes,
+            )
+        
         return auth_url
-    
+
+    def _auth_url_prefix(self, redirect_uri: str, scopes: Tuple[str, ...]) -> str:
+        """Get the authorization URL prefix for a redirect URI and scope set.
+
+        Args:
+            redirect_uri: OAuth redirect URI.
+            scopes: Requested OAuth scopes.
+
+        Returns:
+            str: Authorization URL up to and including redirect_uri.
+        """
+        cache = self._auth_url_prefixes
+        prefix = cache.get((redirect_uri, scopes))
+        if prefix is None:
+            # Bound the cache so adversarial redirect URIs can't grow it
+            if len(cache) >= 32:
+                cache.clear()
+            prefix = (
+                f"{self.auth_url}?{self._static_auth_params}"
+                f"&scope={quote_plus(' '.join(scopes))}"
+                f"&redirect_uri={quote_plus(redirect_uri)}"
+            )
+            cache[(redirect_uri, scopes)] = prefix
+        return prefix
+
     async def exchange_code_for_tokens(
         self,
         code: str,
@@ -98,35 +183,42 @@ class AtlassianOAuthClient(BaseClient):
                 "redirect_uri": redirect_uri,
             }
             
-            self._log_request("POST", self.token_url)
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.token_url,
-                    data=data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=self.timeout,
-                )
-            
+            self._log_request(self._token_request_logger)
+
+            response = await self._client.post(
+                self.token_url,
+                data=data,
+                headers=self._token_headers,
+                timeout=self.timeout,
+            )
+
             duration = time.time() - start_time
-            self._log_response("POST", self.token_url, response.status_code, duration)
+            self._log_response(self._token_request_logger, response.status_code, duration)
             track_external_service("atlassian_oauth", response.status_code, duration)
-            
+
             if response.status_code != 200:
-                error_data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+                # Atlassian's OAuth endpoints return JSON on errors too;
+                # parsing directly avoids the header lookup and string check.
+                try:
+                    error_data = orjson.loads(response.content)
+                except orjson.JSONDecodeError:
+                    error_data = {}
                 raise OAuthError(
                     f"Token exchange failed: {response.status_code}",
                     error_code=error_data.get("error"),
                     error_description=error_data.get("error_description"),
                 )
             
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             
-            # Calculate expiration time
+            # Calculate expiration time once from the epoch clock; the
+            # datetime form is derived from it for serialization.
             expires_at = None
+            expires_at_epoch = None
             if token_data.get("expires_in"):
-                expires_at = datetime.utcnow() + timedelta(seconds=token_data["expires_in"])
-            
+                expires_at_epoch = int(time.time()) + token_data["expires_in"]
+                expires_at = datetime.utcfromtimestamp(expires_at_epoch)
+
             tokens = AuthTokens(
                 access_token=token_data["access_token"],
                 refresh_token=token_data.get("refresh_token"),
@@ -134,50 +226,73 @@ class AtlassianOAuthClient(BaseClient):
                 expires_in=token_data.get("expires_in"),
                 scope=token_data.get("scope"),
                 expires_at=expires_at,
+                expires_at_epoch=expires_at_epoch,
             )
             
-            self.logger.info(
-                "Successfully exchanged code for tokens",
-                has_refresh_token=bool(tokens.refresh_token),
-                expires_in=tokens.expires_in,
-                scope=tokens.scope,
-            )
+            if self._info_enabled:
+                self.logger.info(
+                    "Successfully exchanged code for tokens",
+                    has_refresh_token=bool(tokens.refresh_token),
+                    expires_in=tokens.expires_in,
+                    scope=tokens.scope,
+                )
             
             return tokens
             
-        except OAuthError:
-            raise
-        except httpx.TimeoutException:
-            duration = time.time() - start_time
-            track_external_service("atlassian_oauth", 0, duration)
-            raise ExternalServiceError(
-                "Token exchange request timed out",
-                service="atlassian_oauth",
-            )
         except httpx.RequestError as e:
             duration = time.time() - start_time
             track_external_service("atlassian_oauth", 0, duration)
+            if isinstance(e, httpx.TimeoutException):
+                raise ExternalServiceError(
+                    "Token exchange request timed out",
+                    service="atlassian_oauth",
+                )
             raise ExternalServiceError(
                 f"Token exchange request failed: {str(e)}",
                 service="atlassian_oauth",
                 cause=e,
             )
-        except Exception as e:
-            duration = time.time() - start_time
-            track_external_service("atlassian_oauth", 0, duration)
-            self.logger.error("Unexpected error during token exchange", error=str(e))
-            raise ExternalServiceError(
-                "Unexpected error during token exchange",
-                service="atlassian_oauth",
-                cause=e,
-            )
     
     async def refresh_tokens(self, refresh_token: str) -> AuthTokens:
         """Refresh access token using refresh token.
-        
+
+        Concurrent calls with the same refresh token are coalesced into a
+        single request to Atlassian: the first caller performs the refresh
+        and all others await the same in-flight task. This avoids wasted
+        connections and, with rolling refresh tokens, prevents all but one
+        of the concurrent refreshes from failing.
+
         Args:
             refresh_token: Refresh token.
-            
+
+        Returns:
+            AuthTokens: New access and refresh tokens.
+        """
+        task = self._inflight_refreshes.get(refresh_token)
+        if task is not None:
+            return await task
+
+        lock = self._refresh_locks.setdefault(refresh_token, asyncio.Lock())
+        async with lock:
+            # Re-check after acquiring the lock; another caller may have
+            # started the refresh while we were waiting.
+            task = self._inflight_refreshes.get(refresh_token)
+            if task is None:
+                task = asyncio.create_task(self._do_refresh(refresh_token))
+                self._inflight_refreshes[refresh_token] = task
+
+        try:
+            return await task
+        finally:
+            self._inflight_refreshes.pop(refresh_token, None)
+            self._refresh_locks.pop(refresh_token, None)
+
+    async def _do_refresh(self, refresh_token: str) -> AuthTokens:
+        """Perform the actual token refresh request.
+
+        Args:
+            refresh_token: Refresh token.
+
         Returns:
             AuthTokens: New access and refresh tokens.
         """
@@ -191,35 +306,40 @@ class AtlassianOAuthClient(BaseClient):
                 "refresh_token": refresh_token,
             }
             
-            self._log_request("POST", self.token_url)
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.token_url,
-                    data=data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=self.timeout,
-                )
-            
+            self._log_request(self._token_request_logger)
+
+            response = await self._client.post(
+                self.token_url,
+                data=data,
+                headers=self._token_headers,
+                timeout=self.timeout,
+            )
+
             duration = time.time() - start_time
-            self._log_response("POST", self.token_url, response.status_code, duration)
+            self._log_response(self._token_request_logger, response.status_code, duration)
             track_external_service("atlassian_oauth", response.status_code, duration)
-            
+
             if response.status_code != 200:
-                error_data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+                try:
+                    error_data = orjson.loads(response.content)
+                except orjson.JSONDecodeError:
+                    error_data = {}
                 raise OAuthError(
                     f"Token refresh failed: {response.status_code}",
                     error_code=error_data.get("error"),
                     error_description=error_data.get("error_description"),
                 )
             
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             
-            # Calculate expiration time
+            # Calculate expiration time once from the epoch clock; the
+            # datetime form is derived from it for serialization.
             expires_at = None
+            expires_at_epoch = None
             if token_data.get("expires_in"):
-                expires_at = datetime.utcnow() + timedelta(seconds=token_data["expires_in"])
-            
+                expires_at_epoch = int(time.time()) + token_data["expires_in"]
+                expires_at = datetime.utcfromtimestamp(expires_at_epoch)
+
             tokens = AuthTokens(
                 access_token=token_data["access_token"],
                 refresh_token=token_data.get("refresh_token", refresh_token),
@@ -227,42 +347,31 @@ class AtlassianOAuthClient(BaseClient):
                 expires_in=token_data.get("expires_in"),
                 scope=token_data.get("scope"),
                 expires_at=expires_at,
+                expires_at_epoch=expires_at_epoch,
             )
             
-            self.logger.info(
-                "Successfully refreshed tokens",
-                has_new_refresh_token=token_data.get("refresh_token") != refresh_token,
-                expires_in=tokens.expires_in,
-            )
+            if self._info_enabled:
+                self.logger.info(
+                    "Successfully refreshed tokens",
+                    has_new_refresh_token=token_data.get("refresh_token") != refresh_token,
+                    expires_in=tokens.expires_in,
+                )
             
             return tokens
             
-        except OAuthError:
-            raise
-        except httpx.TimeoutException:
-            duration = time.time() - start_time
-            track_external_service("atlassian_oauth", 0, duration)
-            raise ExternalServiceError(
-                "Token refresh request timed out",
-                service="atlassian_oauth",
-            )
         except httpx.RequestError as e:
             duration = time.time() - start_time
             track_external_service("atlassian_oauth", 0, duration)
+            if isinstance(e, httpx.TimeoutException):
+                raise ExternalServiceError(
+                    "Token refresh request timed out",
+                    service="atlassian_oauth",
+                )
             raise ExternalServiceError(
                 f"Token refresh request failed: {str(e)}",
                 service="atlassian_oauth",
                 cause=e,
             )
-        except Exception as e:
-            duration = time.time() - start_time
-            track_external_service("atlassian_oauth", 0, duration)
-            self.logger.error("Unexpected error during token refresh", error=str(e))
-            raise ExternalServiceError(
-                "Unexpected error during token refresh",
-                service="atlassian_oauth",
-                cause=e,
-            )
     
     async def get_user_info(self, access_token: str) -> UserInfo:
         """Get user information from Atlassian API.
@@ -281,18 +390,17 @@ class AtlassianOAuthClient(BaseClient):
                 "Accept": "application/json",
             }
             
-            user_info_url = f"{self.base_url}/me"
-            self._log_request("GET", user_info_url)
+            user_info_url = self._user_info_url
+            self._log_request(self._user_info_request_logger)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    user_info_url,
-                    headers=headers,
-                    timeout=self.timeout,
-                )
+            response = await self._client.get(
+                user_info_url,
+                headers=headers,
+                timeout=self.timeout,
+            )
             
             duration = time.time() - start_time
-            self._log_response("GET", user_info_url, response.status_code, duration)
+            self._log_response(self._user_info_request_logger, response.status_code, duration)
             track_external_service("atlassian_api", response.status_code, duration)
             
             if response.status_code != 200:
@@ -302,9 +410,11 @@ class AtlassianOAuthClient(BaseClient):
                     status_code=response.status_code,
                 )
             
-            user_data = response.json()
+            user_data = orjson.loads(response.content)
             
-            user_info = UserInfo(
+            # Ingress variant: validates the email format once at the
+            # provider boundary
+            user_info = UserInfoIngress(
                 user_id=user_data["account_id"],
                 email=user_data["email"],
                 name=user_data.get("name"),
@@ -312,65 +422,52 @@ class AtlassianOAuthClient(BaseClient):
                 avatar_url=user_data.get("picture"),
                 locale=user_data.get("locale"),
                 timezone=user_data.get("zoneinfo"),
-                provider=AuthProvider.ATLASSIAN,
+                provider="atlassian",
                 provider_id=user_data["account_id"],
                 last_login=datetime.utcnow(),
             )
             
-            self.logger.info(
-                "Successfully retrieved user info",
-                user_id=user_info.user_id,
-                email=user_info.email,
-            )
+            if self._info_enabled:
+                self.logger.info(
+                    "Successfully retrieved user info",
+                    user_id=user_info.user_id,
+                    email=user_info.email,
+                )
             
             return user_info
             
-        except ExternalServiceError:
-            raise
-        except httpx.TimeoutException:
-            duration = time.time() - start_time
-            track_external_service("atlassian_api", 0, duration)
-            raise ExternalServiceError(
-                "User info request timed out",
-                service="atlassian_api",
-            )
         except httpx.RequestError as e:
             duration = time.time() - start_time
             track_external_service("atlassian_api", 0, duration)
+            if isinstance(e, httpx.TimeoutException):
+                raise ExternalServiceError(
+                    "User info request timed out",
+                    service="atlassian_api",
+                )
             raise ExternalServiceError(
                 f"User info request failed: {str(e)}",
                 service="atlassian_api",
                 cause=e,
             )
-        except Exception as e:
-            duration = time.time() - start_time
-            track_external_service("atlassian_api", 0, duration)
-            self.logger.error("Unexpected error getting user info", error=str(e))
-            raise ExternalServiceError(
-                "Unexpected error getting user info",
-                service="atlassian_api",
-                cause=e,
-            )
     
-    async def revoke_token(self, token: str) -> bool:
+    def revoke_token(self, token: str) -> bool:
         """Revoke an access or refresh token.
-        
+
         Args:
             token: Token to revoke.
-            
+
         Returns:
             bool: True if revoked successfully.
         """
-        start_time = time.time()
-        
         try:
             # Atlassian doesn't provide a standard revocation endpoint,
             # so we'll just log the attempt
-            self.logger.info(
-                "Token revocation requested",
-                # Don't log the actual token for security
-                token_length=len(token),
-            )
+            if self._info_enabled:
+                self.logger.info(
+                    "Token revocation requested",
+                    # Don't log the actual token for security
+                    token_length=len(token),
+                )
             
             # In a real implementation, you might call a revocation endpoint
             # or perform other cleanup actions
@@ -4,8 +4,12 @@ This module provides dependency injection for authentication,
 including user validation and service access.
 """
 
-from typing import Optional
+import asyncio
+import hashlib
+from functools import lru_cache
+from typing import Dict, Optional, Set
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 import structlog
@@ -18,20 +22,89 @@ from .service import AuthService
 security = HTTPBearer(auto_error=False)
 logger = structlog.get_logger(__name__)
 
-# Global auth service instance
-_auth_service: Optional[AuthService] = None
+# Pre-bound logger for the token validation path so failure logging does
+# not re-merge the same static context on every request.
+_validation_logger = logger.bind(component="token_validation")
 
+# Refresh tokens this many seconds before they expire so the refresh
+# round-trip to Atlassian happens off the request path.
+_REFRESH_MARGIN = 60.0
 
+# Token IDs with a background refresh currently in flight.
+_pending_refreshes: Set[str] = set()
+
+# Validated tokens keyed by a hash of the bearer string so repeat requests
+# skip the full validation (DB hit / signature verify). Entries close to
+# expiry fall through to full validation.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_CACHE_EXPIRY_SLACK = 30.0
+
+# In-flight validations keyed like the cache, so a burst of requests with
+# the same (uncached) bearer performs one validation instead of N parallel
+# signature verifies / JWKS fetches.
+_inflight_validations: Dict[bytes, "asyncio.Task[TokenInfo]"] = {}
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Build the cache key for a bearer token.
+
+    Args:
+        token: Raw bearer token.
+
+    Returns:
+        bytes: Fixed-size digest used as the cache key.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def invalidate_cached_token(token: str) -> None:
+    """Remove a token from the validation cache.
+
+    Called on logout so a revoked token stops being served from cache.
+
+    Args:
+        token: Raw bearer token.
+    """
+    _token_cache.pop(_token_cache_key(token), None)
+
+@lru_cache(maxsize=1)
 def get_auth_service() -> AuthService:
     """Get the authentication service instance.
-    
+
     Returns:
         AuthService: Authentication service instance.
     """
-    global _auth_service
-    if _auth_service is None:
-        _auth_service = AuthService()
-    return _auth_service
+    return AuthService()
+
+
+def _schedule_background_refresh(auth_service: AuthService, token_info: TokenInfo) -> None:
+    """Schedule a background refresh for a token nearing expiry.
+
+    Only one refresh task runs per token; concurrent requests for the
+    same token do not stack additional tasks.
+
+    Args:
+        auth_service: Authentication service.
+        token_info: Token information.
+    """
+    if token_info.token_id in _pending_refreshes:
+        return
+
+    _pending_refreshes.add(token_info.token_id)
+
+    async def _refresh() -> None:
+        try:
+            await auth_service.refresh_in_background(token_info)
+        except Exception as e:
+            logger.warning(
+                "Background token refresh failed",
+                token_id=token_info.token_id,
+                error=str(e),
+            )
+        finally:
+            _pending_refreshes.discard(token_info.token_id)
+
+    asyncio.create_task(_refresh())
 
 
 async def get_current_token(
@@ -51,27 +124,53 @@ async def get_current_token(
     """
     if not credentials:
         return None
-    
+
+    cache_key = _token_cache_key(credentials.credentials)
+    cached = _token_cache.get(cache_key)
+    # Serve from cache only while the token is unrevoked and comfortably
+    # inside its lifetime; revocations that bypass invalidate_cached_token
+    # (e.g. flagged during a background refresh) still fall through to a
+    # full validation here.
+    if cached is not None and not cached.revoked:
+        # Epoch-seconds comparison: expires_at may be tz-aware (epoch or
+        # offset-bearing input) or naive (built in-process), so a direct
+        # datetime subtraction against utcnow() can raise TypeError.
+        remaining = cached.expires_in
+        if remaining > _CACHE_EXPIRY_SLACK:
+            if remaining < _REFRESH_MARGIN:
+                _schedule_background_refresh(auth_service, cached)
+            return cached
+
     try:
-        token_info = await auth_service.validate_token(credentials.credentials)
-        
-        # Bind user context for logging
-        structlog.contextvars.bind_contextvars(
-            user_id=token_info.user_id,
-            token_type=token_info.token_type.value,
-        )
-        
+        task = _inflight_validations.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                auth_service.validate_token(credentials.credentials)
+            )
+            _inflight_validations[cache_key] = task
+            try:
+                token_info = await task
+            finally:
+                _inflight_validations.pop(cache_key, None)
+        else:
+            token_info = await task
+        _token_cache[cache_key] = token_info
+
+        # Refresh proactively so the steady state never blocks on Atlassian
+        if token_info.expires_in < _REFRESH_MARGIN:
+            _schedule_background_refresh(auth_service, token_info)
+
         return token_info
         
     except (AuthenticationError, TokenError) as e:
-        logger.warning(
+        _validation_logger.warning(
             "Token validation failed",
             error=str(e),
             path=request.url.path,
         )
         return None
     except Exception as e:
-        logger.error(
+        _validation_logger.error(
             "Unexpected error during token validation",
             error=str(e),
             path=request.url.path,
@@ -101,13 +200,8 @@ async def get_current_user(
         user_info = await auth_service.get_user_info(token_info.user_id)
         
         if user_info and user_info.is_active:
-            # Bind additional user context for logging
-            structlog.contextvars.bind_contextvars(
-                user_email=user_info.email,
-                user_name=user_info.display_name or user_info.name,
-            )
             return user_info
-        
+
         return None
         
     except Exception as e:
@@ -184,13 +278,23 @@ async def require_token(
 
 def require_scopes(*required_scopes: str):
     """Create a dependency that requires specific OAuth scopes.
-    
+
+    Call this once at module scope when declaring routes (e.g.
+    ``check_jira_read = require_scopes("read:jira-work")``) so the
+    required-scope frozenset is built at import time; the returned
+    dependency then does no per-request allocation beyond the set
+    difference.
+
     Args:
         *required_scopes: Required OAuth scopes.
-        
+
     Returns:
         Callable: Dependency function.
     """
+    # Built once when the dependency is created (at route registration),
+    # not per request.
+    required = frozenset(required_scopes)
+
     async def check_scopes(
         request: Request,
         token_info: TokenInfo = Depends(require_token),
@@ -207,8 +311,8 @@ def require_scopes(*required_scopes: str):
         Raises:
             HTTPException: If required scopes are missing.
         """
-        missing_scopes = set(required_scopes) - set(token_info.scope)
-        
+        missing_scopes = required - token_info.scope_set
+
         if missing_scopes:
             logger.warning(
                 "Insufficient scopes",
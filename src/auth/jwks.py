@@ -0,0 +1,144 @@
+"""JWKS fetching and caching.
+
+This module caches the provider's JSON Web Key Set so JWT verification
+does not pay an HTTP round-trip per request. Keys are held for the TTL
+advertised by the endpoint's Cache-Control header and refreshed ahead of
+expiry in the background, keeping the re-fetch latency off the request
+path.
+"""
+
+import asyncio
+import re
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+import structlog
+
+from core.exceptions import ExternalServiceError
+
+from .client import get_http_client
+
+logger = structlog.get_logger(__name__)
+
+# Fallback TTL when the endpoint sends no usable Cache-Control header.
+_DEFAULT_TTL = 86_400
+
+# Start a background refresh once this fraction of the TTL has elapsed,
+# so the cache is repopulated before it ever goes stale.
+_REFRESH_AHEAD_FRACTION = 0.8
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _parse_max_age(cache_control: Optional[str]) -> int:
+    """Extract the max-age TTL from a Cache-Control header.
+
+    Args:
+        cache_control: Raw Cache-Control header value, if any.
+
+    Returns:
+        int: TTL in seconds, falling back to the default.
+    """
+    if cache_control:
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            return int(match.group(1))
+    return _DEFAULT_TTL
+
+
+class JwksCache:
+    """Cache of the provider's signing keys, keyed by key ID.
+
+    The whole key set is fetched at most once per TTL; lookups between
+    fetches are plain dict hits. A refresh task is started in the
+    background once 80% of the TTL has elapsed, so steady-state requests
+    never wait on the JWKS endpoint.
+    """
+
+    def __init__(self, jwks_url: str) -> None:
+        """Initialize the cache.
+
+        Args:
+            jwks_url: URL of the provider's jwks.json endpoint.
+        """
+        self.jwks_url = jwks_url
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at = 0.0
+        self._ttl = float(_DEFAULT_TTL)
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+        self._fetch_lock = asyncio.Lock()
+
+    async def get_key(self, kid: str) -> Dict[str, Any]:
+        """Get the JWK for a key ID.
+
+        Args:
+            kid: Key ID from the JWT header.
+
+        Returns:
+            Dict[str, Any]: The matching JWK.
+
+        Raises:
+            ExternalServiceError: If the key set cannot be fetched.
+            KeyError: If the key ID is unknown after a fresh fetch.
+        """
+        now = time.monotonic()
+        age = now - self._fetched_at
+
+        if self._keys and age < self._ttl:
+            # Kick off a background refresh near expiry; the current keys
+            # stay valid while the new set loads.
+            if (
+                age > self._ttl * _REFRESH_AHEAD_FRACTION
+                and self._refresh_task is None
+            ):
+                self._refresh_task = asyncio.create_task(self._refresh())
+            key = self._keys.get(kid)
+            if key is not None:
+                return key
+
+        # Miss or stale: fetch synchronously. An unknown kid also lands
+        # here, covering provider-side key rotation.
+        await self._fetch()
+        return self._keys[kid]
+
+    async def _refresh(self) -> None:
+        """Refresh the key set in the background, keeping stale keys on failure."""
+        try:
+            await self._fetch()
+        except Exception as e:
+            logger.warning("Background JWKS refresh failed", error=str(e))
+        finally:
+            self._refresh_task = None
+
+    async def _fetch(self) -> None:
+        """Fetch the key set and update the cache and its TTL.
+
+        Raises:
+            ExternalServiceError: If the JWKS endpoint returns an error.
+        """
+        async with self._fetch_lock:
+            # Another waiter may have fetched while this one queued.
+            if self._keys and time.monotonic() - self._fetched_at < 1.0:
+                return
+
+            try:
+                response = await get_http_client().get(self.jwks_url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise ExternalServiceError(
+                    "Failed to fetch JWKS",
+                    service="jwks",
+                    cause=e,
+                ) from e
+
+            payload = response.json()
+            self._keys = {key["kid"]: key for key in payload.get("keys", [])}
+            self._ttl = float(_parse_max_age(response.headers.get("Cache-Control")))
+            self._fetched_at = time.monotonic()
+
+            logger.info(
+                "JWKS refreshed",
+                keys=len(self._keys),
+                ttl=self._ttl,
+            )
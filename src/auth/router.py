@@ -4,8 +4,11 @@ This module provides FastAPI routes for OAuth authentication,
 token management, and user operations.
 """
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from fastapi.security import HTTPAuthorizationCredentials
 import structlog
 
 from core.monitoring import track_request
@@ -20,7 +23,14 @@ from models.auth import (
 )
 from models.common import StatusResponse
 
-from .dependencies import get_auth_service, get_current_user, require_auth, require_token
+from .dependencies import (
+    get_auth_service,
+    get_current_user,
+    invalidate_cached_token,
+    require_auth,
+    require_token,
+    security,
+)
 from .service import AuthService
 
 router = APIRouter()
@@ -49,7 +59,7 @@ async def login(
         
         logger.info(
             "OAuth login initiated",
-            provider=request.provider.value,
+            provider=request.provider,
             state=response.state,
         )
         
@@ -129,11 +139,11 @@ async def oauth_callback(
         # 3. Pass tokens as secure query parameters
         
         # For now, return tokens as JSON response
-        return {
+        return ORJSONResponse({
             "success": True,
-            "tokens": tokens.dict(),
+            "tokens": tokens.model_dump(mode="json"),
             "message": "Authentication successful",
-        }
+        })
         
     except HTTPException:
         raise
@@ -179,6 +189,7 @@ async def logout(
     revoke_all: bool = False,
     user_info: UserInfo = Depends(require_auth),
     token_info: TokenInfo = Depends(require_token),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> StatusResponse:
     """Logout user and revoke tokens.
@@ -200,7 +211,12 @@ async def logout(
             # Just revoke current token
             success = await auth_service.revoke_token(token_info.token_id)
             message = "Current token revoked" if success else "Token not found"
-        
+
+        # Drop the token from the validation cache so revocation is
+        # effective immediately.
+        if credentials:
+            invalidate_cached_token(credentials.credentials)
+
         logger.info(
             "User logged out",
             user_id=user_info.user_id,
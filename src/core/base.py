@@ -4,13 +4,26 @@ This module provides base classes and common utilities used throughout
 the application.
 """
 
+import logging
+import threading
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Generic, Optional, TypeVar
 
-import structlog
+from structlog.types import FilteringBoundLogger
+
+from .logging import get_logger
 
 T = TypeVar("T")
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
+
+# Shared default for services without required configuration keys.
+_EMPTY_KEYS: tuple = ()
+
+# Gate for the hot-path request/response log helpers; refreshed by
+# setup_logging so level changes propagate. A module-level flag keeps the
+# disabled case to a single global load instead of dict construction plus
+# structlog filtering.
+_INFO_ENABLED = logging.getLogger().isEnabledFor(logging.INFO)
 
 
 class BaseService(ABC):
@@ -19,7 +32,9 @@ class BaseService(ABC):
     All service classes should inherit from this base class to ensure
     consistent behavior and logging.
     """
-    
+
+    __slots__ = ("name", "logger")
+
     def __init__(self, name: Optional[str] = None) -> None:
         """Initialize the service.
         
@@ -27,7 +42,7 @@ class BaseService(ABC):
             name: Service name for logging.
         """
         self.name = name or self.__class__.__name__
-        self.logger = structlog.get_logger(self.name)
+        self.logger = get_logger(self.name)
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -43,14 +58,14 @@ class BaseService(ABC):
         
         Override this method to perform service initialization.
         """
-        self.logger.info(f"{self.name} service starting up")
+        self.logger.info("service_starting", service=self.name)
     
     async def shutdown(self) -> None:
         """Service shutdown hook.
         
         Override this method to perform service cleanup.
         """
-        self.logger.info(f"{self.name} service shutting down")
+        self.logger.info("service_shutting_down", service=self.name)
 
 
 class BaseRepository(ABC, Generic[T]):
@@ -59,7 +74,9 @@ class BaseRepository(ABC, Generic[T]):
     Provides common CRUD operations interface that can be implemented
     by concrete repository classes.
     """
-    
+
+    __slots__ = ("entity_name", "logger")
+
     def __init__(self, entity_name: str) -> None:
         """Initialize the repository.
         
@@ -67,7 +84,7 @@ class BaseRepository(ABC, Generic[T]):
             entity_name: Name of the entity for logging.
         """
         self.entity_name = entity_name
-        self.logger = structlog.get_logger(f"{entity_name}Repository")
+        self.logger = get_logger(f"{entity_name}Repository")
     
     @abstractmethod
     async def create(self, entity: T) -> T:
@@ -138,10 +155,12 @@ class BaseClient(ABC):
     Provides common functionality for HTTP clients with error handling,
     retries, and monitoring.
     """
-    
+
+    __slots__ = ("name", "base_url", "timeout", "logger", "_url_cache")
+
     def __init__(self, name: str, base_url: str, timeout: int = 30) -> None:
         """Initialize the client.
-        
+
         Args:
             name: Client name for logging.
             base_url: Base URL for the service.
@@ -150,67 +169,101 @@ class BaseClient(ABC):
         self.name = name
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.logger = structlog.get_logger(f"{name}Client")
-    
+        self.logger = get_logger(f"{name}Client")
+        self._url_cache: Dict[str, str] = {}
+
     def _build_url(self, path: str) -> str:
         """Build full URL from path.
-        
+
+        Clients hit the same handful of paths repeatedly, so built URLs
+        are memoized per instance; the cache is cleared if it grows past
+        256 entries to stay bounded against pathological inputs.
+
         Args:
             path: URL path.
-            
+
         Returns:
             str: Full URL.
         """
-        path = path.lstrip("/")
-        return f"{self.base_url}/{path}"
+        cache = self._url_cache
+        url = cache.get(path)
+        if url is None:
+            if len(cache) > 256:
+                cache.clear()
+            url = f"{self.base_url}/{path.lstrip('/')}"
+            cache[path] = url
+        return url
     
-    def _log_request(self, method: str, url: str, **kwargs) -> None:
-        """Log outgoing request.
-        
+    def _request_logger(self, method: str, url: str) -> FilteringBoundLogger:
+        """Get a logger with the invariant request context pre-bound.
+
+        Bind method/url once per request (or once per instance for static
+        endpoints) and pass the result to _log_request/_log_response, so
+        each log call merges only its own fields.
+
         Args:
             method: HTTP method.
             url: Request URL.
-            **kwargs: Additional request parameters.
+
+        Returns:
+            FilteringBoundLogger: Logger bound with method and url.
         """
-        self.logger.info(
-            "Outgoing request",
-            method=method,
-            url=url,
-            timeout=self.timeout,
-        )
-    
-    def _log_response(self, method: str, url: str, status_code: int, duration: float) -> None:
+        return self.logger.bind(method=method, url=url)
+
+    def _log_request(self, request_logger: FilteringBoundLogger) -> None:
+        """Log outgoing request.
+
+        Args:
+            request_logger: Logger from _request_logger.
+        """
+        if not _INFO_ENABLED:
+            return
+        request_logger.info("Outgoing request", timeout=self.timeout)
+
+    def _log_response(
+        self, request_logger: FilteringBoundLogger, status_code: int, duration: float
+    ) -> None:
         """Log response.
-        
+
         Args:
-            method: HTTP method.
-            url: Request URL.
+            request_logger: Logger from _request_logger.
             status_code: Response status code.
             duration: Request duration in seconds.
         """
-        self.logger.info(
+        if not _INFO_ENABLED:
+            return
+        request_logger.info(
             "Response received",
-            method=method,
-            url=url,
             status_code=status_code,
-            duration=f"{duration:.4f}s",
+            duration=duration,
         )
 
 
 class SingletonMeta(type):
     """Singleton metaclass.
-    
-    Ensures only one instance of a class is created.
+
+    Ensures only one instance of a class is created. The instance is
+    cached directly on the class, so the steady-state path is a single
+    attribute load; creation is double-checked under a per-class lock so
+    concurrent first calls cannot race two instances into existence.
     """
-    
-    _instances = {}
-    
+
+    def __init__(cls, *args, **kwargs):
+        """Initialize the class with its own creation lock."""
+        super().__init__(*args, **kwargs)
+        cls.__singleton_lock__ = threading.Lock()
+
     def __call__(cls, *args, **kwargs):
         """Create or return existing instance."""
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        instance = cls.__dict__.get("__singleton_instance__")
+        if instance is not None:
+            return instance
+        with cls.__singleton_lock__:
+            instance = cls.__dict__.get("__singleton_instance__")
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls.__singleton_instance__ = instance
+        return instance
 
 
 class ConfigurableService(BaseService):
@@ -218,7 +271,9 @@ class ConfigurableService(BaseService):
     
     Provides configuration injection and validation.
     """
-    
+
+    __slots__ = ("config",)
+
     def __init__(self, config: Dict[str, Any], name: Optional[str] = None) -> None:
         """Initialize the service with configuration.
         
@@ -232,24 +287,28 @@ class ConfigurableService(BaseService):
     
     def _validate_config(self) -> None:
         """Validate service configuration.
-        
+
         Override this method to implement configuration validation.
         """
         required_keys = self.get_required_config_keys()
-        missing_keys = [key for key in required_keys if key not in self.config]
-        
+        if not required_keys:
+            return
+
+        config = self.config
+        missing_keys = [key for key in required_keys if key not in config]
+
         if missing_keys:
             raise ValueError(f"Missing required configuration keys: {missing_keys}")
-    
-    def get_required_config_keys(self) -> list[str]:
-        """Get list of required configuration keys.
-        
+
+    def get_required_config_keys(self) -> tuple:
+        """Get required configuration keys.
+
         Override this method to specify required configuration keys.
-        
+
         Returns:
-            list[str]: List of required configuration keys.
+            tuple: Required configuration keys.
         """
-        return []
+        return _EMPTY_KEYS
     
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """Get configuration value.
@@ -4,12 +4,26 @@ This module provides configuration management using Pydantic settings
 with environment variable support.
 """
 
-from functools import lru_cache
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from typing import FrozenSet, List, Optional
 
-from pydantic import Field, validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Fields accepted either as a list or as a comma-separated string.
+_CSV_LIST_FIELDS = (
+    "cors_origins",
+    "cors_allow_methods",
+    "cors_allow_headers",
+    "rate_limit_exempt_paths",
+)
+
+# Allowed values for enum-style settings; frozensets give O(1) membership
+# checks during validation.
+_ENVIRONMENTS = frozenset({"development", "staging", "production"})
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_LOG_FORMATS = frozenset({"json", "text"})
+
 
 class Settings(BaseSettings):
     """Application settings.
@@ -85,6 +99,10 @@ class Settings(BaseSettings):
     log_file: Optional[str] = Field(default=None, description="Log file path")
     log_max_size: str = Field(default="10MB", description="Maximum log file size")
     log_backup_count: int = Field(default=5, description="Number of backup log files")
+    log_batch_size: int = Field(default=512, description="Log records buffered before a batched write")
+    log_flush_interval_ms: int = Field(
+        default=100, description="Maximum milliseconds a buffered log record waits before flushing"
+    )
     
     # CORS settings
     cors_origins: List[str] = Field(
@@ -101,72 +119,75 @@ class Settings(BaseSettings):
     # Rate limiting settings
     rate_limit_per_minute: int = Field(default=60, description="Rate limit per minute")
     rate_limit_burst: int = Field(default=10, description="Rate limit burst")
+    rate_limit_max_clients: int = Field(
+        default=10_000,
+        description="Maximum number of clients tracked by the rate limiter"
+    )
+    rate_limit_exempt_paths: List[str] = Field(
+        default=["/health", "/metrics"],
+        description="Paths exempt from rate limiting"
+    )
     
     # Monitoring settings
     metrics_enabled: bool = Field(default=True, description="Enable Prometheus metrics")
     health_check_enabled: bool = Field(default=True, description="Enable health check endpoint")
     prometheus_port: int = Field(default=8001, description="Prometheus metrics port")
     
-    @validator("cors_origins", pre=True)
-    def parse_cors_origins(cls, v):
-        """Parse CORS origins from string or list."""
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
-        return v
-    
-    @validator("cors_allow_methods", pre=True)
-    def parse_cors_methods(cls, v):
-        """Parse CORS methods from string or list."""
-        if isinstance(v, str):
-            return [method.strip() for method in v.split(",")]
-        return v
-    
-    @validator("cors_allow_headers", pre=True)
-    def parse_cors_headers(cls, v):
-        """Parse CORS headers from string or list."""
-        if isinstance(v, str):
-            return [header.strip() for header in v.split(",")]
-        return v
-    
-    @validator("environment")
+    @model_validator(mode="before")
+    @classmethod
+    def parse_csv_lists(cls, values):
+        """Parse list fields supplied as comma-separated strings."""
+        for field in _CSV_LIST_FIELDS:
+            value = values.get(field)
+            if isinstance(value, str):
+                values[field] = [item.strip() for item in value.split(",")]
+        return values
+
+    @field_validator("environment")
+    @classmethod
     def validate_environment(cls, v):
         """Validate environment value."""
-        allowed = ["development", "staging", "production"]
-        if v not in allowed:
-            raise ValueError(f"Environment must be one of {allowed}")
+        if v not in _ENVIRONMENTS:
+            raise ValueError(f"Environment must be one of {sorted(_ENVIRONMENTS)}")
         return v
-    
-    @validator("log_level")
+
+    @field_validator("log_level")
+    @classmethod
     def validate_log_level(cls, v):
         """Validate log level."""
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in allowed:
-            raise ValueError(f"Log level must be one of {allowed}")
-        return v.upper()
-    
-    @validator("log_format")
+        v = v.upper()
+        if v not in _LOG_LEVELS:
+            raise ValueError(f"Log level must be one of {sorted(_LOG_LEVELS)}")
+        return v
+
+    @field_validator("log_format")
+    @classmethod
     def validate_log_format(cls, v):
         """Validate log format."""
-        allowed = ["json", "text"]
-        if v not in allowed:
-            raise ValueError(f"Log format must be one of {allowed}")
+        if v not in _LOG_FORMATS:
+            raise ValueError(f"Log format must be one of {sorted(_LOG_FORMATS)}")
         return v
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.environment == "development"
-    
-    @property
+
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode."""
         return self.environment == "production"
-    
-    @property
+
+    @cached_property
     def atlassian_scopes_list(self) -> List[str]:
         """Get Atlassian scopes as a list."""
         return [scope.strip() for scope in self.atlassian_scopes.split(",")]
 
+    @cached_property
+    def atlassian_scopes_set(self) -> FrozenSet[str]:
+        """Get Atlassian scopes as a frozenset for membership checks."""
+        return frozenset(self.atlassian_scopes_list)
+
 
 @lru_cache()
 def get_settings() -> Settings:
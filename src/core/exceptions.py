@@ -3,15 +3,22 @@
 This module defines custom exceptions used throughout the application.
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+# Shared read-only mapping returned when an exception carries no details,
+# so raising without details never allocates a fresh dict.
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
 class BaseAppException(Exception):
     """Base exception class for the application.
-    
+
     All custom exceptions should inherit from this class.
     """
-    
+
+    __slots__ = ("message", "_details", "cause")
+
     def __init__(
         self,
         message: str,
@@ -19,7 +26,7 @@ class BaseAppException(Exception):
         cause: Optional[Exception] = None,
     ) -> None:
         """Initialize the exception.
-        
+
         Args:
             message: Error message.
             details: Additional error details.
@@ -27,36 +34,46 @@ class BaseAppException(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self._details = details
         self.cause = cause
+
+    @property
+    def details(self) -> Mapping[str, Any]:
+        """Additional error details, or a shared empty mapping."""
+        return self._details if self._details is not None else _EMPTY_DETAILS
     
-    def __str__(self) -> str:
-        """String representation of the exception."""
-        return self.message
-    
+    # No __str__ override: Exception.__str__ already returns the message
+    # passed to super().__init__, without an extra Python frame per call.
+
     def __repr__(self) -> str:
         """Detailed representation of the exception."""
-        return f"{self.__class__.__name__}('{self.message}', details={self.details})"
+        if self._details:
+            return f"{type(self).__name__}({self.message!r}, details={self._details})"
+        return super().__repr__()
 
 
 class ConfigurationError(BaseAppException):
     """Raised when there's a configuration error."""
-    pass
+
+    __slots__ = ()
 
 
 class AuthenticationError(BaseAppException):
     """Raised when authentication fails."""
-    pass
+
+    __slots__ = ()
 
 
 class AuthorizationError(BaseAppException):
     """Raised when authorization fails."""
-    pass
+
+    __slots__ = ()
 
 
 class ValidationError(BaseAppException):
     """Raised when data validation fails."""
-    pass
+
+    __slots__ = ()
 
 
 class ExternalServiceError(BaseAppException):
@@ -66,7 +83,9 @@ class ExternalServiceError(BaseAppException):
         service: Name of the external service.
         status_code: HTTP status code if applicable.
     """
-    
+
+    __slots__ = ("service", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -95,7 +114,9 @@ class TokenError(AuthenticationError):
     Attributes:
         token_type: Type of token (access, refresh, etc.).
     """
-    
+
+    __slots__ = ("token_type",)
+
     def __init__(
         self,
         message: str,
@@ -122,7 +143,9 @@ class OAuthError(AuthenticationError):
         error_code: OAuth error code.
         error_description: OAuth error description.
     """
-    
+
+    __slots__ = ("error_code", "error_description")
+
     def __init__(
         self,
         message: str,
@@ -152,7 +175,9 @@ class ProxyError(ExternalServiceError):
         target_url: The target URL that failed.
         method: HTTP method used.
     """
-    
+
+    __slots__ = ("target_url", "method")
+
     def __init__(
         self,
         message: str,
@@ -185,7 +210,9 @@ class RateLimitError(BaseAppException):
         window: Rate limit window in seconds.
         retry_after: Seconds to wait before retrying.
     """
-    
+
+    __slots__ = ("limit", "window", "retry_after")
+
     def __init__(
         self,
         message: str,
@@ -4,39 +4,175 @@ This module provides structured logging using structlog with support for
 JSON and text formats.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
+import re
 import sys
+import threading
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, List, Optional
 
+import orjson
 import structlog
 from structlog.types import FilteringBoundLogger, Processor
 
 from .config import Settings
 
+# Correlation ID for the current request. A dedicated ContextVar costs a
+# single pointer set/reset per request, where bind_contextvars would
+# copy-on-write structlog's whole context dict for one value.
+CORRELATION_ID: ContextVar[str] = ContextVar("correlation_id", default="")
+
+
+def _add_correlation_id(
+    logger: Any, method_name: str, event_dict: dict
+) -> dict:
+    """Attach the current correlation ID to the event, if any."""
+    correlation_id = CORRELATION_ID.get()
+    if correlation_id:
+        event_dict["correlation_id"] = correlation_id
+    return event_dict
+
+
+def _orjson_serializer(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event dict with orjson.
+
+    Args:
+        obj: Event dictionary to serialize.
+        **kwargs: Ignored; accepted for JSONRenderer compatibility.
+
+    Returns:
+        str: JSON-encoded event.
+    """
+    return orjson.dumps(obj, default=str).decode()
+
+
+# Processor chains built once at import so repeated setup_logging calls
+# (tests) reuse identical processor instances and keep cached loggers
+# valid.
+_BASE_PROCESSORS = (
+    structlog.contextvars.merge_contextvars,
+    _add_correlation_id,
+    structlog.processors.add_log_level,
+    structlog.processors.StackInfoRenderer(),
+)
+_PROCESSORS = {
+    "json": _BASE_PROCESSORS
+    + (
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.JSONRenderer(serializer=_orjson_serializer),
+    ),
+    "text": _BASE_PROCESSORS
+    + (
+        structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
+        structlog.dev.ConsoleRenderer(),
+    ),
+}
+
+# Listener thread draining the log queue; replaced if setup_logging runs
+# again (tests) and stopped at interpreter exit so queued records flush.
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+# Timer thread bounding how long a buffered record can sit in the batch
+# handlers; managed alongside the listener.
+_flush_thread: Optional[threading.Thread] = None
+_flush_stop: Optional[threading.Event] = None
+
+
+def _stop_queue_listener() -> None:
+    """Stop the log listener and flush threads, draining queued records."""
+    global _queue_listener, _flush_thread, _flush_stop
+    if _flush_stop is not None:
+        _flush_stop.set()
+    if _flush_thread is not None:
+        _flush_thread.join()
+        _flush_thread = None
+        _flush_stop = None
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.flush()
+        _queue_listener = None
+
+
+def _start_flush_thread(
+    handlers: List[logging.Handler], interval_ms: int
+) -> None:
+    """Start the periodic flush thread for the batch handlers.
+
+    Batching alone only flushes on a full buffer, a WARNING+ record, or
+    shutdown; on a quiet service that leaves up to capacity-1 records
+    invisible indefinitely. This thread bounds the wait to the configured
+    interval.
+
+    Args:
+        handlers: Batch handlers to flush.
+        interval_ms: Flush interval in milliseconds.
+    """
+    global _flush_thread, _flush_stop
+    stop_event = threading.Event()
+
+    def _flush_loop() -> None:
+        interval = interval_ms / 1000.0
+        while not stop_event.wait(interval):
+            for handler in handlers:
+                handler.flush()
+
+    _flush_stop = stop_event
+    _flush_thread = threading.Thread(
+        target=_flush_loop, name="log-batch-flush", daemon=True
+    )
+    _flush_thread.start()
+
+
+atexit.register(_stop_queue_listener)
+
+
+@lru_cache(maxsize=None)
+def _filtering_wrapper(level: int) -> type:
+    """Get the filtering bound-logger class for a level.
+
+    Memoized so repeated setup_logging calls at the same level reuse one
+    wrapper class instead of rebuilding it.
+
+    Args:
+        level: Numeric logging level.
+
+    Returns:
+        type: Bound-logger class filtering below the given level.
+    """
+    return structlog.make_filtering_bound_logger(level)
+
 
 def setup_logging(settings: Settings) -> None:
     """Setup structured logging configuration.
-    
+
+    Log records are routed through a queue drained by a single background
+    thread, so request handlers only pay for an O(1) enqueue instead of
+    formatter work and blocking stdout/file writes.
+
     Args:
         settings: Application settings.
     """
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, settings.log_level),
-    )
-    
+    # Resolve the numeric level once; reused for every handler below.
+    level = getattr(logging, settings.log_level)
+
+    # Handlers that actually write records; these run on the listener
+    # thread, never on the request path.
+    output_handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+
     # Setup log file handler if specified
     if settings.log_file:
         log_path = Path(settings.log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
         # Parse log max size
         max_bytes = _parse_size(settings.log_max_size)
-        
+
         # Create rotating file handler
         file_handler = logging.handlers.RotatingFileHandler(
             filename=log_path,
@@ -44,98 +180,98 @@ def setup_logging(settings: Settings) -> None:
             backupCount=settings.log_backup_count,
             encoding="utf-8",
         )
-        file_handler.setLevel(getattr(logging, settings.log_level))
-        
-        # Add file handler to root logger
-        root_logger = logging.getLogger()
-        root_logger.addHandler(file_handler)
-    
-    # Configure structlog
-    processors = [
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
+        file_handler.setLevel(level)
+        output_handlers.append(file_handler)
+
+    # Batch writes on the listener thread: records accumulate in memory
+    # and hit the stream/file in groups of log_batch_size, so steady-state
+    # INFO traffic costs one write syscall per batch instead of per record.
+    # WARNING and above flush immediately, as does shutdown; the flush
+    # thread started below bounds how long a partial batch can linger.
+    output_handlers = [
+        logging.handlers.MemoryHandler(
+            capacity=settings.log_batch_size,
+            flushLevel=logging.WARNING,
+            target=handler,
+            flushOnClose=True,
+        )
+        for handler in output_handlers
     ]
-    
-    if settings.log_format == "json":
-        processors.extend([
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer(),
-        ])
-    else:
-        processors.extend([
-            structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
-            structlog.dev.ConsoleRenderer(),
-        ])
-    
+
+    # Route everything on the root logger through the queue. SimpleQueue
+    # is lock-free on put, so producers never contend with the drainer.
+    _stop_queue_listener()
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+    global _queue_listener
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *output_handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    _start_flush_thread(output_handlers, settings.log_flush_interval_ms)
+
+    # Refresh the hot-path level gates in base and monitoring (imported
+    # late; core.base imports this module).
+    from . import base, monitoring
+
+    base._INFO_ENABLED = root_logger.isEnabledFor(logging.INFO)
+    monitoring._DEBUG_ENABLED = root_logger.isEnabledFor(logging.DEBUG)
+
     # Configure structlog
     structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, settings.log_level)
-        ),
+        processors=list(_PROCESSORS[settings.log_format]),
+        wrapper_class=_filtering_wrapper(level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+_SIZE_RE = re.compile(r"^\s*(\d+)\s*(KB|MB|GB|B)?\s*$", re.IGNORECASE)
+_SIZE_MULTIPLIERS = {
+    "": 1,
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024 * 1024,
+    "GB": 1024 * 1024 * 1024,
+}
+
+
 def _parse_size(size_str: str) -> int:
     """Parse size string to bytes.
-    
+
     Args:
         size_str: Size string like '10MB', '1GB', etc.
-        
+
     Returns:
         int: Size in bytes.
+
+    Raises:
+        ValueError: If the size string is not a number with an optional
+            B/KB/MB/GB suffix.
     """
-    size_str = size_str.upper().strip()
-    
-    if size_str.endswith('KB'):
-        return int(size_str[:-2]) * 1024
-    elif size_str.endswith('MB'):
-        return int(size_str[:-2]) * 1024 * 1024
-    elif size_str.endswith('GB'):
-        return int(size_str[:-2]) * 1024 * 1024 * 1024
-    else:
-        return int(size_str)
-
-
-class CorrelationIDProcessor:
-    """Processor to add correlation ID to log records."""
-    
-    def __init__(self, key: str = "correlation_id") -> None:
-        """Initialize the processor.
-        
-        Args:
-            key: Key name for the correlation ID.
-        """
-        self.key = key
-    
-    def __call__(self, logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Add correlation ID to event dict.
-        
-        Args:
-            logger: Logger instance.
-            method_name: Log method name.
-            event_dict: Event dictionary.
-            
-        Returns:
-            Dict[str, Any]: Updated event dictionary.
-        """
-        # Try to get correlation ID from context variables
-        correlation_id = structlog.contextvars.get_contextvars().get(self.key)
-        if correlation_id:
-            event_dict[self.key] = correlation_id
-        return event_dict
+    match = _SIZE_RE.match(size_str)
+    if not match:
+        raise ValueError(f"Invalid size string: {size_str!r}")
+    return int(match.group(1)) * _SIZE_MULTIPLIERS[(match.group(2) or "").upper()]
 
 
+@lru_cache(maxsize=1024)
 def get_logger(name: str) -> FilteringBoundLogger:
     """Get a structured logger instance.
-    
+
+    Memoized by name so repeated instantiation of services/clients with
+    the same name shares one bound logger instead of re-running the
+    processor-chain binding each time.
+
     Args:
         name: Logger name.
-        
+
     Returns:
         FilteringBoundLogger: Configured logger instance.
     """
@@ -144,12 +280,12 @@ def get_logger(name: str) -> FilteringBoundLogger:
 
 def bind_context(**kwargs: Any) -> None:
     """Bind context variables to the current context.
-    
+
     Args:
         **kwargs: Key-value pairs to bind.
     """
-    for key, value in kwargs.items():
-        structlog.contextvars.bind_contextvars(**{key: value})
+    if kwargs:
+        structlog.contextvars.bind_contextvars(**kwargs)
 
 
 def clear_context() -> None:
@@ -163,4 +299,4 @@ def with_correlation_id(correlation_id: str) -> None:
     Args:
         correlation_id: Correlation ID to bind.
     """
-    bind_context(correlation_id=correlation_id)
\ No newline at end of file
+    CORRELATION_ID.set(correlation_id)
\ No newline at end of file
@@ -2,166 +2,247 @@
 
 This module provides middleware for correlation ID tracking,
 logging, rate limiting, and other cross-cutting concerns.
+
+All middleware here is written against the raw ASGI interface rather
+than Starlette's BaseHTTPMiddleware, which would wrap every request in
+an anyio task group and memory stream.
 """
 
+import asyncio
 import time
 import uuid
-from typing import Awaitable, Callable
+from array import array
+from secrets import token_hex
+from typing import Optional
 
-from fastapi import Request, Response, status
+from cachetools import LRUCache
+from fastapi import status
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import structlog
 
 from .exceptions import RateLimitError
 from .config import get_settings
+from .logging import CORRELATION_ID
 
 settings = get_settings()
 logger = structlog.get_logger(__name__)
 
+# Sliding-window rate limit check executed atomically in Redis: prune
+# entries older than the window, count what is left, record the call only
+# if under the limit, and refresh the key's expiry. Keeping this in one
+# script means multi-worker deployments share a single budget per client
+# at the cost of one round-trip.
+_RATE_LIMIT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1] - ARGV[2])
+local n = redis.call('ZCARD', KEYS[1])
+if n >= tonumber(ARGV[3]) then
+    return n
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+return n
+"""
+
+# How long to serve from the in-memory window after a Redis failure
+# before attempting Redis again.
+_REDIS_RETRY_COOLDOWN = 30.0
+
+
+class _ClientWindow:
+    """Fixed-size ring buffer of call timestamps for one client.
+
+    Admission only ever inspects the slot about to be overwritten: if the
+    oldest recorded call is still inside the window, the client has used
+    all `calls` slots within `period`. That makes the check O(1) and the
+    per-client footprint a flat 8 bytes per allowed call (a C double
+    array), versus a Python float object per call in a deque.
+    """
+
+    __slots__ = ("buf", "head")
+
+    def __init__(self, calls: int) -> None:
+        """Initialize an empty window.
+
+        Args:
+            calls: Number of calls allowed per period.
+        """
+        self.buf = array("d", [0.0]) * calls
+        self.head = 0
+
 
 class CorrelationIDMiddleware:
     """Middleware to add correlation ID to requests.
-    
+
     This middleware generates a unique correlation ID for each request
     and makes it available throughout the request lifecycle.
     """
-    
-    def __init__(
-        self,
-        app: Callable[[Request], Awaitable[Response]],
-        header_name: str = "X-Correlation-ID"
-    ) -> None:
+
+    def __init__(self, app: ASGIApp, header_name: str = "X-Correlation-ID") -> None:
         """Initialize the middleware.
-        
+
         Args:
             app: ASGI application.
             header_name: Header name for correlation ID.
         """
         self.app = app
         self.header_name = header_name
-    
-    async def __call__(self, request: Request, call_next: Callable) -> Response:
+        # ASGI header names are lowercased bytes; pre-encode once so the
+        # per-request lookup is a plain dict hit.
+        self._header_key = header_name.lower().encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with correlation ID.
-        
+
         Args:
-            request: FastAPI request object.
-            call_next: Next middleware/handler in chain.
-            
-        Returns:
-            Response: FastAPI response object.
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
         """
-        # Generate or extract correlation ID
-        correlation_id = request.headers.get(
-            self.header_name, str(uuid.uuid4())
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate or extract correlation ID. token_hex skips the UUID
+        # object construction and dash formatting that uuid4 would do on
+        # every request without an inbound header. Reading scope["headers"]
+        # directly avoids building a Headers object per request.
+        raw_correlation_id = dict(scope["headers"]).get(self._header_key)
+        correlation_id = (
+            raw_correlation_id.decode("latin-1") if raw_correlation_id else token_hex(16)
         )
-        
-        # Bind correlation ID to structlog context
-        structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
-        
-        # Add to request state
-        request.state.correlation_id = correlation_id
-        
+        correlation_id_bytes = raw_correlation_id or correlation_id.encode("latin-1")
+
+        # Publish to the logging context; a dedicated ContextVar set is
+        # one pointer swap, not a context-dict copy per request.
+        token = CORRELATION_ID.set(correlation_id)
+
+        # Add to request state (surfaces as request.state.correlation_id)
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+
+        async def send_with_header(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Append the pre-encoded pair straight onto the raw header
+                # list; MutableHeaders would wrap and re-scan it first.
+                message["headers"].append((self._header_key, correlation_id_bytes))
+            await send(message)
+
         try:
-            response = await call_next(request)
-            
-            # Add correlation ID to response headers
-            response.headers[self.header_name] = correlation_id
-            
-            return response
+            await self.app(scope, receive, send_with_header)
         finally:
             # Clear context
-            structlog.contextvars.clear_contextvars()
+            CORRELATION_ID.reset(token)
 
 
 class LoggingMiddleware:
     """Middleware to log HTTP requests and responses.
-    
+
     This middleware logs request and response information including
     timing, status codes, and other relevant details.
     """
-    
-    def __init__(self, app: Callable[[Request], Awaitable[Response]]) -> None:
+
+    def __init__(self, app: ASGIApp) -> None:
         """Initialize the middleware.
-        
+
         Args:
             app: ASGI application.
         """
         self.app = app
-    
-    async def __call__(self, request: Request, call_next: Callable) -> Response:
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with logging.
-        
+
         Args:
-            request: FastAPI request object.
-            call_next: Next middleware/handler in chain.
-            
-        Returns:
-            Response: FastAPI response object.
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
         """
-        start_time = time.time()
-        
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Monotonic integer nanoseconds: cheaper than time.time(), immune
+        # to clock adjustments mid-request.
+        start_time = time.monotonic_ns()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        # One pass over the raw header list; decode only what gets logged.
+        user_agent = dict(scope["headers"]).get(b"user-agent")
+        # Decode the query string only when one is present
+        qs_bytes = scope.get("query_string", b"")
+
         # Log request
         logger.info(
             "Request started",
-            method=request.method,
-            path=request.url.path,
-            query_params=str(request.query_params),
-            user_agent=request.headers.get("user-agent"),
-            client_ip=request.client.host if request.client else None,
+            method=method,
+            path=path,
+            query_params=qs_bytes.decode() if qs_bytes else "",
+            user_agent=user_agent.decode("latin-1") if user_agent else None,
+            client_ip=client[0] if client else None,
         )
-        
+
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add timing header directly to the raw header list
+                message["headers"].append((
+                    b"x-process-time",
+                    f"{(time.monotonic_ns() - start_time) / 1e9:.4f}".encode("latin-1"),
+                ))
+            await send(message)
+
         try:
-            response = await call_next(request)
-            
+            await self.app(scope, receive, send_with_timing)
+
             # Calculate processing time
-            process_time = time.time() - start_time
-            
+            process_time = (time.monotonic_ns() - start_time) / 1e9
+
             # Log response
             logger.info(
                 "Request completed",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                process_time=f"{process_time:.4f}s",
+                method=method,
+                path=path,
+                status_code=status_code,
+                process_time=process_time,
             )
-            
-            # Add timing header
-            response.headers["X-Process-Time"] = str(process_time)
-            
-            return response
-            
+
         except Exception as exc:
             # Calculate processing time
-            process_time = time.time() - start_time
-            
-            # Log exception
+            process_time = (time.monotonic_ns() - start_time) / 1e9
+
+            # Log exception without exc_info: QueueHandler formats the
+            # traceback on the request thread before enqueueing, and the
+            # app-level exception handler already logs the full stack once.
             logger.error(
                 "Request failed",
-                method=request.method,
-                path=request.url.path,
-                process_time=f"{process_time:.4f}s",
+                method=method,
+                path=path,
+                process_time=process_time,
                 error=str(exc),
-                exc_info=True,
             )
-            
+
             raise
 
 
 class RateLimitMiddleware:
     """Middleware to implement rate limiting.
-    
+
     This is a simple in-memory rate limiter. For production use,
     consider using Redis or another distributed storage.
     """
-    
+
     def __init__(
         self,
-        app: Callable[[Request], Awaitable[Response]],
+        app: ASGIApp,
         calls: int = None,
         period: int = 60
     ) -> None:
         """Initialize the middleware.
-        
+
         Args:
             app: ASGI application.
             calls: Number of calls allowed per period.
@@ -170,103 +251,243 @@ class RateLimitMiddleware:
         self.app = app
         self.calls = calls or settings.rate_limit_per_minute
         self.period = period
-        self.clients = {}
-    
-    async def __call__(self, request: Request, call_next: Callable) -> Response:
+        # Built once; membership checks per request are O(1) with no
+        # list allocation. Mounted exempt apps (e.g. /metrics) redirect
+        # to a trailing-slash path, so both spellings are included.
+        self.exempt_paths = frozenset(
+            variant
+            for path in settings.rate_limit_exempt_paths
+            for variant in (path, path.rstrip("/") + "/")
+        )
+        # LRU-bounded so a flood of distinct client IDs (e.g. spoofed
+        # X-Forwarded-For values) evicts the least recently seen entry
+        # instead of growing without bound.
+        self.clients: LRUCache = LRUCache(maxsize=settings.rate_limit_max_clients)
+        # Periodic sweep of inactive clients; started lazily from the
+        # first request because no event loop runs at middleware init.
+        self._sweeper_task: Optional["asyncio.Task[None]"] = None
+        # Redis-backed sliding window, used when redis_url is configured
+        # so all workers enforce one shared budget. Created lazily on the
+        # first request; a Redis failure flips the middleware to the
+        # in-memory window until the retry cooldown elapses, then the
+        # client is rebuilt on the next request.
+        self._redis = None
+        self._rate_limit_script = None
+        self._redis_retry_at = 0.0
+        # Pre-encoded X-RateLimit-Limit pair; the limit never changes.
+        self._limit_header = (b"x-ratelimit-limit", str(self.calls).encode())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with rate limiting.
-        
+
         Args:
-            request: FastAPI request object.
-            call_next: Next middleware/handler in chain.
-            
-        Returns:
-            Response: FastAPI response object.
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
         """
-        # Skip rate limiting for health check
-        if request.url.path in ["/health", "/metrics"]:
-            return await call_next(request)
-        
+        # Bind hot attributes once; the checks below then run on locals
+        # (LOAD_FAST) instead of repeated attribute lookups.
+        app = self.app
+        calls = self.calls
+        period = self.period
+
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+
+        # Skip rate limiting for exempt paths (health checks, metrics)
+        if scope["path"] in self.exempt_paths:
+            await app(scope, receive, send)
+            return
+
+        if self._sweeper_task is None:
+            self._sweeper_task = asyncio.create_task(self._sweep_loop())
+
         # Get client identifier
-        client_id = self._get_client_id(request)
+        client_id = self._get_client_id(scope)
         current_time = time.time()
-        
-        # Clean up old entries
-        self._cleanup_old_entries(current_time)
-        
+
+        # Shared Redis window when configured; falls back below if Redis
+        # is down or unconfigured.
+        if settings.redis_url and time.monotonic() >= self._redis_retry_at:
+            count = await self._check_redis_limit(client_id, current_time)
+            if count is not None:
+                if count >= calls:
+                    await self._reject(scope, receive, send, client_id, count, period)
+                    return
+
+                # Surface the remaining budget from the count the script
+                # already returned; pairs are appended onto the raw header
+                # list like the correlation header above.
+                rate_limit_headers = (
+                    self._limit_header,
+                    (b"x-ratelimit-remaining", str(calls - count - 1).encode()),
+                    (b"x-ratelimit-reset", str(int(current_time) + period).encode()),
+                )
+
+                async def send_with_headers(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        message["headers"].extend(rate_limit_headers)
+                    await send(message)
+
+                await app(scope, receive, send_with_headers)
+                return
+
         # Check rate limit
-        if client_id not in self.clients:
-            self.clients[client_id] = []
-        
-        client_calls = self.clients[client_id]
-        
-        # Remove old calls outside the time window
-        client_calls[:] = [
-            call_time for call_time in client_calls
-            if current_time - call_time < self.period
-        ]
-        
-        # Check if rate limit exceeded
-        if len(client_calls) >= self.calls:
-            retry_after = int(self.period - (current_time - client_calls[0])) + 1
-            
-            logger.warning(
-                "Rate limit exceeded",
-                client_id=client_id,
-                calls=len(client_calls),
-                limit=self.calls,
-                period=self.period,
-                retry_after=retry_after,
-            )
-            
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "detail": "Rate limit exceeded",
-                    "retry_after": retry_after,
-                },
-                headers={"Retry-After": str(retry_after)},
+        clients = self.clients
+        window = clients.get(client_id)
+        if window is None:
+            window = clients[client_id] = _ClientWindow(calls)
+
+        # The slot at head holds the oldest recorded call (or 0.0 while
+        # the buffer is still filling); if it is still inside the window,
+        # the client has exhausted its budget.
+        oldest = window.buf[window.head]
+        if current_time - oldest < period:
+            retry_after = int(period - (current_time - oldest)) + 1
+            await self._reject(
+                scope, receive, send, client_id, calls, retry_after
             )
-        
-        # Record this call
-        client_calls.append(current_time)
-        
-        return await call_next(request)
-    
-    def _get_client_id(self, request: Request) -> str:
+            return
+
+        # Record this call, overwriting the expired slot
+        window.buf[window.head] = current_time
+        window.head = (window.head + 1) % calls
+
+        await app(scope, receive, send)
+
+    async def _reject(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        client_id: str,
+        call_count: int,
+        retry_after: int,
+    ) -> None:
+        """Send a 429 response for a rate-limited request.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+            client_id: Client identifier.
+            call_count: Calls observed in the current window.
+            retry_after: Seconds to wait before retrying.
+        """
+        logger.warning(
+            "Rate limit exceeded",
+            client_id=client_id,
+            calls=call_count,
+            limit=self.calls,
+            period=self.period,
+            retry_after=retry_after,
+        )
+
+        response = JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={
+                "detail": "Rate limit exceeded",
+                "retry_after": retry_after,
+            },
+            headers={
+                "Retry-After": str(retry_after),
+                "X-RateLimit-Limit": str(self.calls),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + retry_after),
+            },
+        )
+        await response(scope, receive, send)
+
+    def _get_client_id(self, scope: Scope) -> str:
         """Get client identifier for rate limiting.
-        
+
         Args:
-            request: FastAPI request object.
-            
+            scope: ASGI connection scope.
+
         Returns:
             str: Client identifier.
         """
         # Use X-Forwarded-For header if present (behind proxy)
-        forwarded_for = request.headers.get("x-forwarded-for")
+        forwarded_for = dict(scope["headers"]).get(b"x-forwarded-for")
         if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
+            # Split on bytes and decode only the first address
+            return forwarded_for.split(b",", 1)[0].strip().decode("latin-1")
+
         # Use direct client IP
-        return request.client.host if request.client else "unknown"
-    
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    async def _check_redis_limit(
+        self, client_id: str, current_time: float
+    ) -> Optional[int]:
+        """Run the sliding-window check in Redis.
+
+        Args:
+            client_id: Client identifier.
+            current_time: Current timestamp.
+
+        Returns:
+            Optional[int]: Calls in the current window, or None if Redis
+                is unavailable and the in-memory window should be used.
+        """
+        try:
+            if self._rate_limit_script is None:
+                import redis.asyncio as aredis
+
+                self._redis = aredis.from_url(settings.redis_url)
+                self._rate_limit_script = self._redis.register_script(_RATE_LIMIT_LUA)
+
+            return int(
+                await self._rate_limit_script(
+                    keys=[f"rate_limit:{client_id}"],
+                    args=[
+                        int(current_time * 1000),
+                        self.period * 1000,
+                        self.calls,
+                        uuid.uuid4().hex,
+                    ],
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                "Redis rate limiting unavailable, falling back to in-memory",
+                error=str(e),
+                retry_in=_REDIS_RETRY_COOLDOWN,
+            )
+            # Drop the client so the next attempt after the cooldown
+            # rebuilds it from scratch.
+            self._redis = None
+            self._rate_limit_script = None
+            self._redis_retry_at = time.monotonic() + _REDIS_RETRY_COOLDOWN
+            return None
+
+    async def _sweep_loop(self) -> None:
+        """Periodically drop clients with no calls in the window.
+
+        Runs once per period so request latency stays independent of the
+        number of tracked clients.
+        """
+        while True:
+            await asyncio.sleep(self.period)
+            self._cleanup_old_entries(time.time())
+
     def _cleanup_old_entries(self, current_time: float) -> None:
         """Clean up old client entries.
-        
+
+        Not called on the request path; admission in __call__ is O(1) and
+        this full sweep runs periodically.
+
         Args:
             current_time: Current timestamp.
         """
-        # Remove clients with no recent calls
-        clients_to_remove = []
-        for client_id, calls in self.clients.items():
-            # Remove old calls
-            calls[:] = [
-                call_time for call_time in calls
-                if current_time - call_time < self.period
-            ]
-            # Mark client for removal if no recent calls
-            if not calls:
-                clients_to_remove.append(client_id)
-        
-        # Remove inactive clients
+        # Remove clients whose most recent call is outside the window.
+        # head - 1 is the slot written last; negative indexing wraps.
+        clients_to_remove = [
+            client_id
+            for client_id, window in self.clients.items()
+            if current_time - window.buf[window.head - 1] >= self.period
+        ]
+
         for client_id in clients_to_remove:
-            del self.clients[client_id]
\ No newline at end of file
+            del self.clients[client_id]
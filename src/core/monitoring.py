@@ -4,15 +4,30 @@ This module provides Prometheus metrics collection and monitoring
 functionality for the application.
 """
 
+import asyncio
+import gzip
+import logging
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, Optional
 
-from prometheus_client import Counter, Histogram, Info, Summary
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Histogram,
+    Info,
+    REGISTRY,
+    Summary,
+    generate_latest,
+)
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Hot-path gate for the per-call debug logs below; refreshed by
+# setup_logging once the real level is known, mirroring base._INFO_ENABLED.
+_DEBUG_ENABLED = logging.getLogger().isEnabledFor(logging.DEBUG)
+
 # Prometheus metrics
 request_count = Counter(
     "http_requests_total",
@@ -81,6 +96,44 @@ app_info = Info(
 )
 
 
+# Label-child lookups hash the label values and take a lock inside
+# prometheus_client on every call; the helpers below memoize the child
+# per label tuple so the hot tracking paths do a single dict hit.
+@lru_cache(maxsize=4096)
+def _request_count_child(method: str, endpoint: str, status_code: int):
+    return request_count.labels(method, endpoint, status_code)
+
+
+@lru_cache(maxsize=1024)
+def _request_duration_child(method: str, endpoint: str):
+    return request_duration.labels(method, endpoint)
+
+
+@lru_cache(maxsize=256)
+def _auth_attempts_child(auth_type: str, status: str):
+    return auth_attempts.labels(auth_type, status)
+
+
+@lru_cache(maxsize=1024)
+def _proxy_requests_child(target: str, status: str):
+    return proxy_requests.labels(target, status)
+
+
+@lru_cache(maxsize=512)
+def _proxy_duration_child(target: str):
+    return proxy_duration.labels(target)
+
+
+@lru_cache(maxsize=1024)
+def _external_service_requests_child(service: str, status_code: int):
+    return external_service_requests.labels(service, status_code)
+
+
+@lru_cache(maxsize=256)
+def _external_service_duration_child(service: str):
+    return external_service_duration.labels(service)
+
+
 def setup_monitoring() -> None:
     """Setup monitoring and metrics collection."""
     logger.info("Setting up monitoring")
@@ -101,16 +154,8 @@ def track_request(method: str, endpoint: str, status_code: int, duration: float)
         status_code: Response status code.
         duration: Request duration in seconds.
     """
-    request_count.labels(
-        method=method,
-        endpoint=endpoint,
-        status_code=status_code
-    ).inc()
-    
-    request_duration.labels(
-        method=method,
-        endpoint=endpoint
-    ).observe(duration)
+    _request_count_child(method, endpoint, status_code).inc()
+    _request_duration_child(method, endpoint).observe(duration)
 
 
 def track_auth_attempt(auth_type: str, status: str) -> None:
@@ -120,7 +165,7 @@ def track_auth_attempt(auth_type: str, status: str) -> None:
         auth_type: Type of authentication (oauth, token, etc.).
         status: Status (success, failure, error).
     """
-    auth_attempts.labels(type=auth_type, status=status).inc()
+    _auth_attempts_child(auth_type, status).inc()
 
 
 def track_proxy_request(target: str, status: str, duration: Optional[float] = None) -> None:
@@ -131,10 +176,10 @@ def track_proxy_request(target: str, status: str, duration: Optional[float] = No
         status: Request status.
         duration: Request duration in seconds.
     """
-    proxy_requests.labels(target=target, status=status).inc()
-    
+    _proxy_requests_child(target, status).inc()
+
     if duration is not None:
-        proxy_duration.labels(target=target).observe(duration)
+        _proxy_duration_child(target).observe(duration)
 
 
 def track_oauth_flow(provider: str, status: str) -> None:
@@ -155,12 +200,8 @@ def track_external_service(service: str, status_code: int, duration: float) -> N
         status_code: HTTP status code.
         duration: Request duration in seconds.
     """
-    external_service_requests.labels(
-        service=service,
-        status_code=status_code
-    ).inc()
-    
-    external_service_duration.labels(service=service).observe(duration)
+    _external_service_requests_child(service, status_code).inc()
+    _external_service_duration_child(service).observe(duration)
 
 
 def track_active_token(token_type: str, increment: bool = True) -> None:
@@ -198,27 +239,33 @@ def monitor_function(component: str):
         Callable: Decorated function.
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
-            try:
-                result = await func(*args, **kwargs)
-                return result
-            except Exception as e:
-                track_error(type(e).__name__, component)
-                raise
-            finally:
-                duration = time.time() - start_time
-                logger.debug(
-                    "Function execution completed",
-                    function=func.__name__,
-                    component=component,
-                    duration=f"{duration:.4f}s"
-                )
-        
+        # Build only the wrapper that matches the function type; the other
+        # closure would be allocated and discarded on every decoration.
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_time = time.monotonic_ns()
+                try:
+                    result = await func(*args, **kwargs)
+                    return result
+                except Exception as e:
+                    track_error(type(e).__name__, component)
+                    raise
+                finally:
+                    if _DEBUG_ENABLED:
+                        duration = (time.monotonic_ns() - start_time) / 1e9
+                        logger.debug(
+                            "Function execution completed",
+                            function=func.__name__,
+                            component=component,
+                            duration=duration,
+                        )
+
+            return async_wrapper
+
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.monotonic_ns()
             try:
                 result = func(*args, **kwargs)
                 return result
@@ -226,20 +273,16 @@ def monitor_function(component: str):
                 track_error(type(e).__name__, component)
                 raise
             finally:
-                duration = time.time() - start_time
-                logger.debug(
-                    "Function execution completed",
-                    function=func.__name__,
-                    component=component,
-                    duration=f"{duration:.4f}s"
-                )
-        
-        # Return appropriate wrapper based on function type
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+                if _DEBUG_ENABLED:
+                    duration = (time.monotonic_ns() - start_time) / 1e9
+                    logger.debug(
+                        "Function execution completed",
+                        function=func.__name__,
+                        component=component,
+                        duration=duration,
+                    )
+
+        return sync_wrapper
     
     return decorator
 
@@ -260,13 +303,13 @@ class MetricsCollector:
     
     def __enter__(self):
         """Start timing."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End timing and record metrics."""
         if self.start_time:
-            duration = time.time() - self.start_time
+            duration = (time.monotonic_ns() - self.start_time) / 1e9
             
             if exc_type:
                 track_error(exc_type.__name__, self.component)
@@ -274,13 +317,68 @@ class MetricsCollector:
                     "Operation failed",
                     operation=self.operation,
                     component=self.component,
-                    duration=f"{duration:.4f}s",
+                    duration=duration,
                     error=str(exc_val),
                 )
-            else:
+            elif _DEBUG_ENABLED:
                 logger.debug(
                     "Operation completed",
                     operation=self.operation,
                     component=self.component,
-                    duration=f"{duration:.4f}s",
-                )
\ No newline at end of file
+                    duration=duration,
+                )
+
+class CachedMetricsApp:
+    """ASGI app serving Prometheus metrics from a short-lived cache.
+
+    make_asgi_app() re-serializes the whole registry on every scrape.
+    This app renders at most once per ``ttl`` seconds and keeps both the
+    plain and gzipped payloads, so concurrent scrapers share one render
+    and gzip-capable ones pull ~10x fewer bytes over the wire.
+    """
+
+    __slots__ = ("ttl", "_rendered_at", "_payload", "_gzipped")
+
+    def __init__(self, ttl: float = 1.0) -> None:
+        """Initialize the metrics app.
+
+        Args:
+            ttl: Minimum seconds between registry renders.
+        """
+        self.ttl = ttl
+        self._rendered_at = 0.0
+        self._payload = b""
+        self._gzipped = b""
+
+    async def __call__(self, scope, receive, send) -> None:
+        """Serve the cached metrics payload.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+        """
+        if scope["type"] != "http":
+            return
+
+        now = time.monotonic()
+        if not self._payload or now - self._rendered_at >= self.ttl:
+            self._payload = generate_latest(REGISTRY)
+            self._gzipped = gzip.compress(self._payload, compresslevel=5)
+            self._rendered_at = now
+
+        headers = [(b"content-type", CONTENT_TYPE_LATEST.encode("latin-1"))]
+        accept_encoding = dict(scope["headers"]).get(b"accept-encoding", b"")
+        if b"gzip" in accept_encoding:
+            body = self._gzipped
+            headers.append((b"content-encoding", b"gzip"))
+        else:
+            body = self._payload
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": headers,
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -6,20 +6,22 @@ routers, and configuration.
 
 import logging
 import sys
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator
 
+import httpx
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
-from prometheus_client import make_asgi_app
+from fastapi.responses import JSONResponse, ORJSONResponse
 import structlog
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from auth.client import close_http_client, get_http_client
 from auth.router import router as auth_router
 from core.config import get_settings
 from core.exceptions import (
@@ -34,7 +36,8 @@ from core.middleware import (
     LoggingMiddleware,
     RateLimitMiddleware,
 )
-from core.monitoring import setup_monitoring
+from core.monitoring import CachedMetricsApp, setup_monitoring
+from models.common import HealthResponse
 from proxy.router import router as proxy_router
 
 # Initialize settings
@@ -56,11 +59,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Setup monitoring
     setup_monitoring()
-    
+
+    # Prime the pooled connection to Atlassian so the first login doesn't
+    # pay the TCP+TLS handshake; failure here is non-fatal.
+    try:
+        await get_http_client().get(
+            settings.atlassian_auth_url,
+            follow_redirects=False,
+        )
+        logger.info("Warmed up connection to Atlassian")
+    except httpx.HTTPError as e:
+        logger.warning("Atlassian connection warmup failed", error=str(e))
+
     yield
-    
+
     # Shutdown
     logger.info("Shutting down Atlassian OAuth Proxy")
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
@@ -76,6 +91,7 @@ def create_app() -> FastAPI:
         description="A secure OAuth proxy service for Atlassian integrations",
         debug=settings.debug,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.environment != "production" else None,
         redoc_url="/redoc" if settings.environment != "production" else None,
     )
@@ -108,16 +124,30 @@ def create_app() -> FastAPI:
     # Add exception handlers
     add_exception_handlers(app)
     
-    # Add health check endpoint
-    @app.get("/health", tags=["health"])
-    async def health_check():
+    # Add health check endpoint. Responses are identical within a
+    # second, so load-balancer polls reuse one frozen instance instead
+    # of allocating a fresh payload per probe.
+    health_cache = {"rendered_at": 0.0, "response": None}
+
+    @app.get("/health", response_model=HealthResponse, tags=["health"])
+    async def health_check() -> HealthResponse:
         """Health check endpoint."""
-        return {"status": "healthy", "version": settings.app_version}
-    
-    # Add metrics endpoint if enabled
+        now = time.monotonic()
+        if (
+            health_cache["response"] is None
+            or now - health_cache["rendered_at"] >= 1.0
+        ):
+            health_cache["response"] = HealthResponse(
+                status="healthy", version=settings.app_version
+            )
+            health_cache["rendered_at"] = now
+        return health_cache["response"]
+    
+    # Add metrics endpoint if enabled; the cached app renders the
+    # registry at most once per second and serves gzip to scrapers that
+    # accept it
     if settings.metrics_enabled:
-        metrics_app = make_asgi_app()
-        app.mount("/metrics", metrics_app)
+        app.mount("/metrics", CachedMetricsApp())
     
     return app
 
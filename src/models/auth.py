@@ -4,42 +4,48 @@ This module contains Pydantic models for authentication,
 OAuth flows, and token management.
 """
 
-from datetime import datetime
-from enum import Enum
-from typing import Dict, List, Optional
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Literal, Optional
 
-from pydantic import Field, validator, EmailStr
+from pydantic import ConfigDict, Field, model_validator, validator, EmailStr
 
 from .common import BaseModel, TimestampedModel
 
 
-class TokenType(str, Enum):
-    """Token type enumeration."""
-    
-    ACCESS = "access"
-    REFRESH = "refresh"
-    ID = "id"
+def _epoch(dt: datetime) -> float:
+    """Convert a datetime to unix seconds, treating naive values as UTC.
 
+    Args:
+        dt: Expiry timestamp, naive (UTC by convention here) or aware.
 
-class AuthProvider(str, Enum):
-    """Authentication provider enumeration."""
-    
-    ATLASSIAN = "atlassian"
+    Returns:
+        float: Unix timestamp.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
 
-class OAuthState(str, Enum):
-    """OAuth flow state enumeration."""
-    
-    INITIATED = "initiated"
-    AUTHORIZED = "authorized"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    EXPIRED = "expired"
+# Literal aliases rather than str-Enums: pydantic-core validates a
+# Literal with a set-membership test instead of constructing an enum
+# member per field, and values are plain strings end to end.
+TokenType = Literal["access", "refresh", "id"]
+AuthProvider = Literal["atlassian"]
+OAuthState = Literal["initiated", "authorized", "completed", "failed", "expired"]
 
 
 class AuthTokens(BaseModel):
-    """Authentication tokens model."""
-    
+    """Authentication tokens model.
+
+    Constructed in one shot by the OAuth client and never mutated;
+    frozen instances skip the per-assignment validation path and are
+    smaller to construct.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     access_token: str = Field(..., description="Access token")
     refresh_token: Optional[str] = Field(None, description="Refresh token")
     id_token: Optional[str] = Field(None, description="ID token")
@@ -47,6 +53,10 @@ class AuthTokens(BaseModel):
     expires_in: Optional[int] = Field(None, description="Token expiration in seconds")
     scope: Optional[str] = Field(None, description="Token scope")
     expires_at: Optional[datetime] = Field(None, description="Token expiration timestamp")
+    expires_at_epoch: Optional[int] = Field(
+        None,
+        description="Token expiration as unix epoch seconds for cheap comparisons",
+    )
     
     @validator("token_type")
     def validate_token_type(cls, v):
@@ -56,22 +66,57 @@ class AuthTokens(BaseModel):
 
 class TokenInfo(TimestampedModel):
     """Token information model."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     token_id: str = Field(..., description="Unique token identifier")
     user_id: str = Field(..., description="User identifier")
     token_type: TokenType = Field(..., description="Token type")
     provider: AuthProvider = Field(..., description="Authentication provider")
     scope: List[str] = Field(default_factory=list, description="Token scopes")
     expires_at: datetime = Field(..., description="Token expiration timestamp")
+    expires_at_ts: float = Field(
+        default=0.0,
+        description="Token expiration as unix seconds for cheap comparisons",
+    )
     revoked: bool = Field(default=False, description="Whether token is revoked")
     last_used: Optional[datetime] = Field(None, description="Last usage timestamp")
     client_info: Optional[Dict[str, str]] = Field(None, description="Client information")
     
+    @model_validator(mode="before")
+    @classmethod
+    def derive_expires_at_ts(cls, values):
+        """Derive the epoch expiry before validation (the model is frozen)."""
+        if isinstance(values, dict) and not values.get("expires_at_ts"):
+            expires_at = values.get("expires_at")
+            if isinstance(expires_at, datetime):
+                values["expires_at_ts"] = _epoch(expires_at)
+        return values
+
+    @cached_property
+    def scope_set(self) -> FrozenSet[str]:
+        """Token scopes as a frozenset for O(1) membership checks."""
+        return frozenset(self.scope)
+
+    @property
+    def expires_in(self) -> float:
+        """Seconds until expiry; negative once expired.
+
+        Works in unix seconds so callers never mix naive and aware
+        datetimes (expires_at is tz-aware when parsed from an epoch or
+        offset-bearing ISO string, naive when built in-process).
+        """
+        return (self.expires_at_ts or _epoch(self.expires_at)) - time.time()
+
     @property
     def is_expired(self) -> bool:
-        """Check if token is expired."""
-        return datetime.utcnow() > self.expires_at
-    
+        """Check if token is expired.
+
+        Compares unix seconds: one C-level float compare instead of a
+        datetime.utcnow() allocation per call.
+        """
+        return time.time() > (self.expires_at_ts or _epoch(self.expires_at))
+
     @property
     def is_valid(self) -> bool:
         """Check if token is valid."""
@@ -80,9 +125,11 @@ class TokenInfo(TimestampedModel):
 
 class UserInfo(TimestampedModel):
     """User information model."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     user_id: str = Field(..., description="Unique user identifier")
-    email: EmailStr = Field(..., description="User email address")
+    email: str = Field(..., description="User email address")
     name: Optional[str] = Field(None, description="User full name")
     display_name: Optional[str] = Field(None, description="User display name")
     avatar_url: Optional[str] = Field(None, description="User avatar URL")
@@ -96,10 +143,21 @@ class UserInfo(TimestampedModel):
     is_active: bool = Field(default=True, description="Whether user is active")
 
 
+class UserInfoIngress(UserInfo):
+    """UserInfo variant validated at the provider boundary.
+
+    Runs the full email-validator check once when user data arrives from
+    the OAuth provider; cached and outbound UserInfo instances then carry
+    the already-validated address as a plain str.
+    """
+
+    email: EmailStr = Field(..., description="User email address")
+
+
 class LoginRequest(BaseModel):
     """Login request model."""
     
-    provider: AuthProvider = Field(default=AuthProvider.ATLASSIAN, description="Authentication provider")
+    provider: AuthProvider = Field(default="atlassian", description="Authentication provider")
     redirect_uri: Optional[str] = Field(None, description="Custom redirect URI")
     state: Optional[str] = Field(None, description="OAuth state parameter")
     scopes: Optional[List[str]] = Field(None, description="Requested scopes")
@@ -140,25 +198,42 @@ class OAuthSession(TimestampedModel):
     session_id: str = Field(..., description="Unique session identifier")
     state: str = Field(..., description="OAuth state parameter")
     provider: AuthProvider = Field(..., description="Authentication provider")
-    status: OAuthState = Field(default=OAuthState.INITIATED, description="Session status")
+    status: OAuthState = Field(default="initiated", description="Session status")
     redirect_uri: str = Field(..., description="Redirect URI")
     requested_scopes: List[str] = Field(default_factory=list, description="Requested scopes")
     granted_scopes: Optional[List[str]] = Field(None, description="Granted scopes")
     user_id: Optional[str] = Field(None, description="User ID after successful auth")
     client_info: Optional[Dict[str, str]] = Field(None, description="Client information")
     expires_at: datetime = Field(..., description="Session expiration timestamp")
+    expires_at_ts: float = Field(
+        default=0.0,
+        description="Session expiration as unix seconds for cheap comparisons",
+    )
     error_code: Optional[str] = Field(None, description="Error code if failed")
     error_description: Optional[str] = Field(None, description="Error description if failed")
     
+    @model_validator(mode="before")
+    @classmethod
+    def derive_expires_at_ts(cls, values):
+        """Derive the epoch expiry alongside the datetime field."""
+        if isinstance(values, dict) and not values.get("expires_at_ts"):
+            expires_at = values.get("expires_at")
+            if isinstance(expires_at, datetime):
+                values["expires_at_ts"] = _epoch(expires_at)
+        return values
+
     @property
     def is_expired(self) -> bool:
-        """Check if session is expired."""
-        return datetime.utcnow() > self.expires_at
+        """Check if session is expired.
+
+        Compares unix seconds; see TokenInfo.is_expired.
+        """
+        return time.time() > (self.expires_at_ts or _epoch(self.expires_at))
     
     @property
     def is_active(self) -> bool:
         """Check if session is active."""
         return (
-            self.status in [OAuthState.INITIATED, OAuthState.AUTHORIZED]
+            self.status in ("initiated", "authorized")
             and not self.is_expired
         )
\ No newline at end of file
@@ -7,8 +7,13 @@ used throughout the application.
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+import orjson
 from pydantic import BaseModel as PydanticBaseModel, Field, ConfigDict
 
+# Bound once at import; each default_factory call then skips the
+# per-instantiation module attribute lookup on datetime.
+_now = datetime.utcnow
+
 
 class BaseModel(PydanticBaseModel):
     """Base model with common configuration."""
@@ -16,23 +21,37 @@ class BaseModel(PydanticBaseModel):
     model_config = ConfigDict(
         # Use enum values instead of enum objects
         use_enum_values=True,
-        # Validate assignment to model fields
-        validate_assignment=True,
         # Allow population by field name and alias
         populate_by_name=True,
-        # Serialize by alias
-        ser_by_alias=True,
-        # Exclude None values from serialization
-        exclude_none=True,
+        # Trust already-constructed child models: parent validation keeps
+        # the instance instead of re-validating (and cloning) each child
+        revalidate_instances="never",
     )
 
+    # exclude_none / ser_by_alias are not ConfigDict keys (they were
+    # silently ignored); None-skipping is applied here instead so every
+    # dump drops the many unset Optional fields by default.
+    def model_dump(self, **kwargs):
+        """Dump the model, excluding None fields unless told otherwise."""
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs):
+        """Dump the model to JSON, excluding None fields unless told otherwise."""
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(**kwargs)
+
 
 class HealthResponse(BaseModel):
     """Health check response model."""
     
+    # Write-once response payloads; frozen construction skips the setattr
+    # guard path and makes instances safe to cache and share.
+    model_config = ConfigDict(frozen=True)
+    
     status: str = Field(..., description="Health status")
     version: str = Field(..., description="Application version")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Response timestamp")
     uptime: Optional[float] = Field(None, description="Application uptime in seconds")
     checks: Optional[Dict[str, Any]] = Field(None, description="Detailed health checks")
 
@@ -40,10 +59,12 @@ class HealthResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Standard error response model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     detail: str = Field(..., description="Error detail message")
     type: str = Field(..., description="Error type")
     code: Optional[str] = Field(None, description="Error code")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Error timestamp")
     correlation_id: Optional[str] = Field(None, description="Request correlation ID")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
 
@@ -69,13 +90,47 @@ class PaginatedResponse(BaseModel):
 class TimestampedModel(BaseModel):
     """Base model with timestamp fields."""
     
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=_now, description="Creation timestamp")
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "TimestampedModel":
+        """Rehydrate an instance from already-validated data.
+
+        For cache reads where the payload was validated before being
+        stored: model_construct skips the validator chain, so keys must
+        match field names exactly and values must already be coerced.
+
+        Args:
+            data: Field-name-keyed, pre-validated payload.
+
+        Returns:
+            TimestampedModel: Constructed instance.
+        """
+        return cls.model_construct(**data)
+
 
 class StatusResponse(BaseModel):
     """Generic status response."""
     
+    model_config = ConfigDict(frozen=True)
+    
     success: bool = Field(..., description="Operation success status")
     message: Optional[str] = Field(None, description="Status message")
-    data: Optional[Dict[str, Any]] = Field(None, description="Additional data")
\ No newline at end of file
+    data: Optional[Dict[str, Any]] = Field(None, description="Additional data")
+
+
+def fast_dumps(model: PydanticBaseModel) -> bytes:
+    """Serialize a model to JSON bytes with orjson.
+
+    Faster than model_dump_json for the datetime- and dict-heavy payloads
+    the proxy produces: pydantic only builds the python-mode dict and
+    orjson's serializer does the encoding.
+
+    Args:
+        model: Model instance to serialize.
+
+    Returns:
+        bytes: JSON-encoded model.
+    """
+    return orjson.dumps(model.model_dump(mode="json", exclude_none=True))
@@ -3,36 +3,56 @@
 This module contains Pydantic models for proxy requests and responses.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union, get_args
 
-from pydantic import Field, validator
+from pydantic import ConfigDict, Field, StrictBytes, StrictStr, TypeAdapter, validator
 
 from .common import BaseModel, TimestampedModel
 
+# Lowercased forms of header names seen so far. Real traffic repeats the
+# same few dozen names, so normalization becomes a dict hit instead of a
+# str.lower call per header; cleared if it ever grows past the cap.
+_HEADER_LOWER_CACHE: Dict[str, str] = {}
 
-class HttpMethod(str, Enum):
-    """HTTP method enumeration."""
-    
-    GET = "GET"
-    POST = "POST"
-    PUT = "PUT"
-    PATCH = "PATCH"
-    DELETE = "DELETE"
-    HEAD = "HEAD"
-    OPTIONS = "OPTIONS"
 
+def _lower_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Normalize header names to lowercase via the shared cache.
 
-class ProxyStatus(str, Enum):
-    """Proxy request status enumeration."""
-    
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    TIMEOUT = "timeout"
-    CANCELLED = "cancelled"
+    Args:
+        headers: Header mapping with arbitrary-case names.
+
+    Returns:
+        Dict[str, str]: Mapping with lowercased names.
+    """
+    cache = _HEADER_LOWER_CACHE
+    if len(cache) > 512:
+        cache.clear()
+    normalized = {}
+    for key, value in headers.items():
+        lower = cache.get(key)
+        if lower is None:
+            lower = cache[key] = key.lower()
+        normalized[lower] = value
+    return normalized
+
+
+# Literal aliases rather than str-Enums: pydantic-core validates a
+# Literal with a set-membership test instead of constructing an enum
+# member per field, and values are plain strings end to end.
+HttpMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
+ProxyStatus = Literal[
+    "pending", "in_progress", "completed", "failed", "timeout", "cancelled"
+]
+
+# Runtime tuple of all methods, for defaults and iteration.
+ALL_HTTP_METHODS = get_args(HttpMethod)
+
+# Body payloads: strict arms tried left to right, so validation stops at
+# the first exact type match instead of smart-union probing (and lax
+# str/bytes cross-coercion never rewrites the payload).
+_Body = Optional[Union[StrictStr, StrictBytes, Dict[str, Any]]]
 
 
 class ProxyRequest(BaseModel):
@@ -45,9 +65,10 @@ class ProxyRequest(BaseModel):
         default_factory=dict, 
         description="Query parameters"
     )
-    body: Optional[Union[str, bytes, Dict[str, Any]]] = Field(
+    body: _Body = Field(
         None, 
-        description="Request body"
+        description="Request body",
+        union_mode="left_to_right",
     )
     timeout: Optional[int] = Field(
         None, 
@@ -80,27 +101,65 @@ class ProxyRequest(BaseModel):
     @validator("headers")
     def normalize_headers(cls, v):
         """Normalize header names to lowercase."""
-        return {key.lower(): value for key, value in v.items()}
+        return _lower_headers(v)
+
+    @classmethod
+    def fast_get(
+        cls, path: str, headers: Optional[Dict[str, str]] = None
+    ) -> "ProxyRequest":
+        """Build a GET request from trusted, pre-normalized inputs.
+
+        model_construct skips the validator chain entirely, so callers
+        must supply a leading-slash path and lowercase header names —
+        the shape the gateway hot path already produces.
+
+        Args:
+            path: Target path, starting with '/'.
+            headers: Pre-lowercased request headers.
+
+        Returns:
+            ProxyRequest: Constructed request.
+        """
+        return cls.model_construct(
+            method="GET",
+            path=path,
+            headers=headers if headers is not None else {},
+            query_params={},
+            body=None,
+            timeout=None,
+            retry_count=0,
+            follow_redirects=True,
+            verify_ssl=True,
+        )
 
 
 class ProxyResponse(BaseModel):
     """Proxy response model."""
     
+    # Write-once after the upstream call completes
+    model_config = ConfigDict(frozen=True)
+    
     status_code: int = Field(..., description="HTTP status code")
     headers: Dict[str, str] = Field(default_factory=dict, description="Response headers")
-    body: Optional[Union[str, bytes, Dict[str, Any]]] = Field(
+    body: _Body = Field(
         None, 
-        description="Response body"
+        description="Response body",
+        union_mode="left_to_right",
     )
     content_type: Optional[str] = Field(None, description="Content type")
     content_length: Optional[int] = Field(None, description="Content length")
     elapsed_time: float = Field(..., description="Request duration in seconds")
     retry_count: int = Field(default=0, description="Number of retries performed")
+    # Discriminator for Union[ProxyResponse, ProxyError] fields; a tagged
+    # union picks the arm with one lookup instead of try-each-arm.
+    outcome: Literal["response"] = Field(
+        default="response", description="Batch outcome discriminator"
+    )
     
     @validator("headers")
     def normalize_headers(cls, v):
         """Normalize header names to lowercase."""
-        return {key.lower(): value for key, value in v.items()}
+        return _lower_headers(v)
 
 
 class ProxyError(BaseModel):
@@ -112,36 +171,47 @@ class ProxyError(BaseModel):
     retry_count: int = Field(default=0, description="Number of retries performed")
     elapsed_time: float = Field(..., description="Time elapsed before error")
     details: Dict[str, Any] = Field(default_factory=dict, description="Additional error details")
+    # See ProxyResponse.outcome
+    outcome: Literal["error"] = Field(
+        default="error", description="Batch outcome discriminator"
+    )
 
 
-class ProxyMetrics(BaseModel):
-    """Proxy request metrics model."""
-    
-    request_id: str = Field(..., description="Unique request identifier")
-    target_url: str = Field(..., description="Target URL")
-    method: HttpMethod = Field(..., description="HTTP method")
-    status: ProxyStatus = Field(..., description="Request status")
-    start_time: datetime = Field(..., description="Request start time")
-    end_time: Optional[datetime] = Field(None, description="Request end time")
-    duration: Optional[float] = Field(None, description="Request duration in seconds")
-    status_code: Optional[int] = Field(None, description="HTTP status code")
-    request_size: Optional[int] = Field(None, description="Request size in bytes")
-    response_size: Optional[int] = Field(None, description="Response size in bytes")
-    retry_count: int = Field(default=0, description="Number of retries performed")
-    error_message: Optional[str] = Field(None, description="Error message if failed")
-    user_id: Optional[str] = Field(None, description="User who made the request")
-    correlation_id: Optional[str] = Field(None, description="Request correlation ID")
+@dataclass(slots=True)
+class ProxyMetrics:
+    """Proxy request metrics.
+
+    A plain slotted dataclass rather than a Pydantic model: instances are
+    built internally from already-validated data once per proxied request,
+    so construction skips the validator machinery and each instance drops
+    the per-object __dict__.
+    """
+
+    request_id: str
+    target_url: str
+    method: HttpMethod
+    status: ProxyStatus
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    duration: Optional[float] = None
+    status_code: Optional[int] = None
+    request_size: Optional[int] = None
+    response_size: Optional[int] = None
+    retry_count: int = 0
+    error_message: Optional[str] = None
+    user_id: Optional[str] = None
+    correlation_id: Optional[str] = None
     
     @property
     def is_completed(self) -> bool:
         """Check if request is completed."""
-        return self.status in [ProxyStatus.COMPLETED, ProxyStatus.FAILED]
+        return self.status in ("completed", "failed")
     
     @property
     def is_successful(self) -> bool:
         """Check if request was successful."""
         return (
-            self.status == ProxyStatus.COMPLETED 
+            self.status == "completed"
             and self.status_code 
             and 200 <= self.status_code < 400
         )
@@ -156,7 +226,7 @@ class ProxyConfiguration(BaseModel):
     max_retries: int = Field(default=3, description="Maximum number of retries")
     retry_backoff: float = Field(default=1.0, description="Retry backoff multiplier")
     allowed_methods: List[HttpMethod] = Field(
-        default_factory=lambda: list(HttpMethod),
+        default_factory=lambda: list(ALL_HTTP_METHODS),
         description="Allowed HTTP methods"
     )
     blocked_paths: List[str] = Field(
@@ -212,15 +282,69 @@ class BatchProxyRequest(BaseModel):
         description="Overall timeout for batch request"
     )
 
+    def to_soa(self) -> "BatchProxyRequestSoA":
+        """Repack the batch into parallel per-field lists.
+
+        Returns:
+            BatchProxyRequestSoA: Flattened view for the dispatch loop.
+        """
+        methods = []
+        paths = []
+        header_names = []
+        header_values = []
+        bodies = []
+        timeouts = []
+        for request in self.requests:
+            methods.append(request.method)
+            paths.append(request.path)
+            header_names.append(list(request.headers.keys()))
+            header_values.append(list(request.headers.values()))
+            bodies.append(request.body)
+            timeouts.append(request.timeout)
+        return BatchProxyRequestSoA(
+            methods=methods,
+            paths=paths,
+            header_names=header_names,
+            header_values=header_values,
+            bodies=bodies,
+            timeouts=timeouts,
+        )
+
+
+@dataclass(slots=True)
+class BatchProxyRequestSoA:
+    """Structure-of-arrays view of a batch for the dispatch loop.
+
+    Parallel lists let the HTTP client's header-building loop walk one
+    flat sequence per field instead of hopping between per-request dicts;
+    headers are unpacked once here rather than per dispatch attempt.
+    """
+
+    methods: List[str]
+    paths: List[str]
+    header_names: List[List[str]]
+    header_values: List[List[str]]
+    bodies: List[Optional[Union[str, bytes, Dict[str, Any]]]]
+    timeouts: List[Optional[int]]
+
 
 class BatchProxyResponse(BaseModel):
     """Batch proxy response model."""
     
-    responses: List[Union[ProxyResponse, ProxyError]] = Field(
+    responses: List[
+        Annotated[Union[ProxyResponse, ProxyError], Field(discriminator="outcome")]
+    ] = Field(
         ..., 
         description="List of responses or errors"
     )
     successful_count: int = Field(..., description="Number of successful requests")
     failed_count: int = Field(..., description="Number of failed requests")
     total_duration: float = Field(..., description="Total batch duration in seconds")
-    parallel_execution: bool = Field(..., description="Whether requests were executed in parallel")
\ No newline at end of file
+    parallel_execution: bool = Field(..., description="Whether requests were executed in parallel")
+
+# Module-level adapter singletons: building a TypeAdapter compiles a new
+# pydantic-core SchemaValidator, so hot paths must reuse these instead of
+# constructing one per call.
+PROXY_REQUEST_ADAPTER = TypeAdapter(ProxyRequest)
+PROXY_RESPONSE_ADAPTER = TypeAdapter(ProxyResponse)
+BATCH_REQUEST_ADAPTER = TypeAdapter(BatchProxyRequest)